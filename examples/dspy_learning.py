@@ -13,10 +13,16 @@ DSPy is a framework that provides a structured way to program with language mode
 using "signatures" (input/output specifications) and "modules" (composable components).
 """
 
+import asyncio
 import os
+from collections.abc import Callable
 
 import dspy
 
+# Maximum number of LLM requests the demos keep in flight at once.
+# Questions are answered concurrently, but a cap keeps us under provider rate limits.
+MAX_CONCURRENT_REQUESTS = 4
+
 # === DSPy Signature Definitions ===
 # Signatures in DSPy define the input and output structure for language model calls.
 # They act like function signatures, specifying what the model should expect and return.
@@ -89,6 +95,15 @@ class SimpleQA(dspy.Module):
         prediction = self.generate_answer(question=question)
         return prediction
 
+    async def aforward(self, question: str):
+        """
+        Async version of forward, used to answer many questions concurrently.
+
+        DSPy modules expose `acall`, which awaits the LM request instead of
+        blocking the thread, so several questions can wait on the network at once.
+        """
+        return await self.generate_answer.acall(question=question)
+
 
 class EnhancedQA(dspy.Module):
     """
@@ -125,6 +140,61 @@ class EnhancedQA(dspy.Module):
             fact_check_explanation=fact_check_result.explanation,
         )
 
+    async def aforward(self, question: str):
+        """
+        Async version of forward.
+
+        The fact check still waits for its own answer, but different questions
+        run their QA + fact-check pipelines concurrently.
+        """
+        qa_result = await self.qa_module.acall(question=question)
+        fact_check_result = await self.fact_checker.acall(statement=qa_result.answer)
+
+        return dspy.Prediction(
+            question=question,
+            answer=qa_result.answer,
+            is_factual=fact_check_result.is_factual,
+            fact_check_explanation=fact_check_result.explanation,
+        )
+
+
+async def answer_concurrently(
+    module: dspy.Module,
+    questions: list[str],
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    on_answer: Callable[[int, str, object], None] | None = None,
+) -> list:
+    """
+    Run a module's aforward on every question concurrently.
+
+    With N questions the total wait is roughly the slowest answer instead of
+    the sum of all answers. A semaphore caps how many requests are in flight.
+
+    Args:
+        on_answer: Called with (question number, question, result) as soon as
+            each question finishes, so answers can be shown without waiting
+            for the slowest one. Callbacks run one at a time on the event
+            loop, so their output never interleaves.
+
+    Returns:
+        One result per question, in order. Failed questions hold the exception.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def answer(number: int, question: str):
+        async with semaphore:
+            try:
+                result = await module.aforward(question)
+            except Exception as e:
+                result = e
+        if on_answer is not None:
+            on_answer(number, question, result)
+        return result
+
+    return await asyncio.gather(
+        *(answer(i, question) for i, question in enumerate(questions, 1))
+    )
+
 
 def setup_openrouter_lm() -> dspy.LM | None:
     """
@@ -186,27 +256,28 @@ def demonstrate_basic_qa():
         "What are the benefits of using DSPy for AI programming?",
     ]
 
-    for i, question in enumerate(questions, 1):
+    def show(i: int, question: str, result) -> None:
         print(f"\n📝 Question {i}: {question}")
         print("-" * 40)
 
-        try:
-            # Get the answer using our DSPy module
-            result = qa_module(question)
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}")
+            return
 
-            print(f"🎯 Answer: {result.answer}")
+        print(f"🎯 Answer: {result.answer}")
 
-            # DSPy modules often include reasoning traces
-            if hasattr(result, "rationale"):
-                print(f"🧠 Reasoning: {result.rationale}")
+        # DSPy modules often include reasoning traces
+        if hasattr(result, "rationale"):
+            print(f"🧠 Reasoning: {result.rationale}")
 
-            # Show the prompt history for debugging
-            print("\n🔍 DEBUG: Prompt History")
-            print("-" * 30)
-            dspy.inspect_history(n=1)  # Show last prompt
+    # Ask all questions at once; each answer is shown as soon as it arrives
+    asyncio.run(answer_concurrently(qa_module, questions, on_answer=show))
 
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    # Show the prompt history for debugging
+    # (requests ran concurrently, so prompts appear in completion order)
+    print("\n🔍 DEBUG: Prompt History")
+    print("-" * 30)
+    dspy.inspect_history(n=len(questions))
 
 
 def demonstrate_enhanced_qa():
@@ -229,25 +300,26 @@ def demonstrate_enhanced_qa():
         "How many moons does Mars have?",
     ]
 
-    for i, question in enumerate(questions, 1):
+    def show(i: int, question: str, result) -> None:
         print(f"\n📝 Question {i}: {question}")
         print("-" * 40)
 
-        try:
-            # Get enhanced answer with fact-checking
-            result = enhanced_qa(question)
+        if isinstance(result, Exception):
+            print(f"❌ Error: {result}")
+            return
 
-            print(f"🎯 Answer: {result.answer}")
-            print(f"✅ Factual Assessment: {result.is_factual}")
-            print(f"📋 Fact Check Notes: {result.fact_check_explanation}")
+        print(f"🎯 Answer: {result.answer}")
+        print(f"✅ Factual Assessment: {result.is_factual}")
+        print(f"📋 Fact Check Notes: {result.fact_check_explanation}")
 
-            # Show detailed prompt history for this complex workflow
-            print("\n🔍 DEBUG: Full Prompt History for Enhanced QA")
-            print("-" * 45)
-            dspy.inspect_history(n=2)  # Show last 2 prompts (QA + fact check)
+    # Each question's QA -> fact-check chain runs concurrently with the others,
+    # and each result is shown as soon as its chain finishes
+    asyncio.run(answer_concurrently(enhanced_qa, questions, on_answer=show))
 
-        except Exception as e:
-            print(f"❌ Error: {e}")
+    # Show detailed prompt history for this complex workflow
+    print("\n🔍 DEBUG: Full Prompt History for Enhanced QA")
+    print("-" * 45)
+    dspy.inspect_history(n=2 * len(questions))  # QA + fact check per question
 
 
 def main():
@@ -9,7 +9,27 @@ __version__ = "0.1.0"
 __author__ = "Manuel Porto"
 __email__ = "manuel@example.com"
 
-from .cli.main import main
-from .core import TestGenEnsemble
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cli.main import main
+    from .core import TestGenEnsemble
 
 __all__ = ["TestGenEnsemble", "main", "__version__"]
+
+# Public names resolved on first access, so importing the package (e.g. for
+# the CLI) does not pull in DSPy
+_LAZY_ATTRIBUTES = {
+    "TestGenEnsemble": ".core",
+    "main": ".cli.main",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported attributes on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
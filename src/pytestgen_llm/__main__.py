@@ -0,0 +1,8 @@
+"""
+Allow running PyTestGen-LLM with ``python -m pytestgen_llm``.
+"""
+
+from .cli.main import main
+
+if __name__ == "__main__":
+    main()
@@ -2,63 +2,94 @@
 Command-line interface for PyTestGen-LLM.
 """
 
-import click
-from rich.console import Console
-from rich.panel import Panel
+import argparse
+from collections.abc import Sequence
+from pathlib import Path
 
 from pytestgen_llm import __version__
 
-console = Console()
+DESCRIPTION = (
+    "PyTestGen-LLM: Local Unit Test Improver using DSPy and Ensemble LLM "
+    "Strategies. Automatically improve existing Python unit tests using Large "
+    "Language Models with rigorous quality assurance and coverage guarantees."
+)
 
 
-@click.command()
-@click.option(
-    "--test-file",
-    type=click.Path(exists=True),
-    help="Path to the test file to improve",
-)
-@click.option(
-    "--source-file",
-    type=click.Path(exists=True),
-    help="Path to the source file being tested (optional, for enhanced context)",
-)
-@click.option(
-    "--ensemble",
-    is_flag=True,
-    help="Use ensemble mode with multiple strategies (recommended)",
-)
-@click.option(
-    "--output-format",
-    type=click.Choice(["diff", "json", "file"]),
-    default="diff",
-    help="Output format for results",
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Run in evaluation mode without modifying files",
-)
-@click.option(
-    "--verbose",
-    "-v",
-    is_flag=True,
-    help="Enable verbose logging",
-)
-@click.version_option(version=__version__)
-def main(
-    test_file: str | None,
-    source_file: str | None,
-    ensemble: bool,
-    output_format: str,
-    dry_run: bool,
-    verbose: bool,
-) -> None:
+def _existing_path(value: str) -> str:
+    """Argument type accepting only paths that exist."""
+    if not Path(value).exists():
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return value
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser.
+
+    Returns:
+        Parser for the ``pytestgen-llm`` command
+    """
+    parser = argparse.ArgumentParser(prog="pytestgen-llm", description=DESCRIPTION)
+    parser.add_argument(
+        "--test-file",
+        type=_existing_path,
+        help="Path to the test file to improve",
+    )
+    parser.add_argument(
+        "--source-file",
+        type=_existing_path,
+        help="Path to the source file being tested (optional, for enhanced context)",
+    )
+    parser.add_argument(
+        "--ensemble",
+        action="store_true",
+        help="Use ensemble mode with multiple strategies (recommended)",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["diff", "json", "file"],
+        default="diff",
+        help="Output format for results",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Run in evaluation mode without modifying files",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Submit LLM calls through the provider Batch API (cheaper, not real time)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s, version {__version__}"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> None:
     """
     PyTestGen-LLM: Local Unit Test Improver using DSPy and Ensemble LLM Strategies.
 
     Automatically improve existing Python unit tests using Large Language Models
     with rigorous quality assurance and coverage guarantees.
+
+    Args:
+        argv: Command-line arguments, defaults to ``sys.argv[1:]``
     """
+    args = build_parser().parse_args(argv)
+
+    # Imported after parsing so --help and --version return immediately
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console()
 
     # Display welcome banner
     console.print(
@@ -69,7 +100,7 @@ def main(
         )
     )
 
-    if not test_file:
+    if not args.test_file:
         console.print(
             "[yellow]⚠️  No test file specified. Use --test-file to provide a test file to improve.[/yellow]\n"
         )
@@ -85,15 +116,22 @@ def main(
 
     # Show configuration
     console.print("\n[bold]Configuration:[/bold]")
-    console.print(f"  Test file: [blue]{test_file}[/blue]")
-    if source_file:
-        console.print(f"  Source file: [blue]{source_file}[/blue]")
+    console.print(f"  Test file: [blue]{args.test_file}[/blue]")
+    if args.source_file:
+        console.print(f"  Source file: [blue]{args.source_file}[/blue]")
     console.print(
-        f"  Mode: [green]{'Ensemble' if ensemble else 'Single Strategy'}[/green]"
+        f"  Mode: [green]{'Ensemble' if args.ensemble else 'Single Strategy'}[/green]"
     )
-    console.print(f"  Output: [cyan]{output_format}[/cyan]")
-    if dry_run:
+    console.print(f"  Output: [cyan]{args.output_format}[/cyan]")
+    if args.dry_run:
         console.print("  [yellow]Dry run: No files will be modified[/yellow]")
+    if args.batch_api:
+        console.print("  Submission: [cyan]provider Batch API[/cyan]")
+
+    # Process-wide LiteLLM connection pool, installed once before any LLM call
+    from pytestgen_llm.core.http import configure_http_clients
+
+    configure_http_clients()
 
     # TODO: This is where the actual test improvement logic will go
     console.print("\n[red]🚧 Implementation coming in next phases![/red]")
@@ -0,0 +1,147 @@
+"""
+Prompt layout tuned for provider-side prompt caching.
+
+Providers cache prompts by exact prefix: OpenAI automatically reuses prefixes
+of 1024+ tokens and Anthropic reuses blocks marked with ``cache_control``.
+DSPy's default chat layout starts every prompt with the signature's field
+descriptions and instructions, so the prompts of different strategies
+diverge at the very first token even though they all embed the same, much
+larger, source code.
+
+``SourceFirstChatAdapter`` moves the source code inputs to the front of the
+system message. Every strategy run on the same files then shares one long
+identical prefix, followed by the short strategy-specific instructions.
+"""
+
+import copy
+import functools
+import weakref
+from typing import Any
+
+import dspy
+from dspy.adapters.utils import format_field_value
+
+# Input fields holding large source code shared by every strategy
+SOURCE_FIELDS = ("existing_test_class", "class_under_test")
+
+# Rendered prompts kept per adapter; each entry holds one set of source files
+FORMAT_CACHE_SIZE = 1024
+
+
+class SourceFirstChatAdapter(dspy.ChatAdapter):
+    """
+    Chat adapter that renders shared source code ahead of the instructions.
+
+    The source fields are removed from the user message and emitted as the
+    opening block of the system message, in ``SOURCE_FIELDS`` order.
+
+    Rendered messages are memoized by signature and inputs, so the calls of
+    one strategy at several temperatures (and their retries) render the
+    prompt once.
+    """
+
+    def __init__(self, *args: Any, cache_control: bool = False, **kwargs: Any):
+        """
+        Initialize the adapter.
+
+        Args:
+            cache_control: Mark the source block with Anthropic's
+                ``cache_control`` so it is cached explicitly.
+        """
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+        self._system_messages: weakref.WeakKeyDictionary[type[dspy.Signature], str] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._format_cached = functools.lru_cache(maxsize=FORMAT_CACHE_SIZE)(
+            self._format_impl
+        )
+
+    def format_system_message(self, signature: type[dspy.Signature]) -> str:
+        """Render the system message once per signature and reuse it."""
+        message = self._system_messages.get(signature)
+        if message is None:
+            message = super().format_system_message(signature)
+            self._system_messages[signature] = message
+        return message
+
+    def format(
+        self,
+        signature: type[dspy.Signature],
+        demos: list[dict[str, Any]],
+        inputs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Format messages, reusing the rendering of identical earlier calls."""
+        if demos:
+            return self._render(signature, demos, inputs)
+        try:
+            inputs_key = frozenset(inputs.items())
+            hash(inputs_key)
+        except TypeError:
+            # Unhashable input values (e.g. lists or images) are rendered fresh
+            return self._render(signature, demos, inputs)
+        messages = self._format_cached(signature, inputs_key)
+        # Callers may mutate the messages, so never hand out the cached ones
+        return copy.deepcopy(messages)
+
+    def _format_impl(
+        self,
+        signature: type[dspy.Signature],
+        inputs_key: frozenset[tuple[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Render the messages of a demo-free call for the memo."""
+        return self._render(signature, [], dict(inputs_key))
+
+    def _render(
+        self,
+        signature: type[dspy.Signature],
+        demos: list[dict[str, Any]],
+        inputs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Render messages with the source code inputs as the leading block."""
+        source_fields = [
+            name
+            for name in SOURCE_FIELDS
+            if name in signature.input_fields and name in inputs
+        ]
+        if not source_fields:
+            return super().format(signature, demos, inputs)
+
+        remaining = {k: v for k, v in inputs.items() if k not in source_fields}
+        messages = super().format(signature, demos, remaining)
+
+        source_block = "\n\n".join(
+            ["The source code below is the input for the task that follows."]
+            + [
+                f"[[ ## {name} ## ]]\n"
+                f"{format_field_value(signature.input_fields[name], inputs[name])}"
+                for name in source_fields
+            ]
+        )
+        system_message = messages[0]["content"]
+
+        if self.cache_control:
+            messages[0]["content"] = [
+                {
+                    "type": "text",
+                    "text": source_block,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {"type": "text", "text": system_message},
+            ]
+        else:
+            messages[0]["content"] = f"{source_block}\n\n{system_message}"
+
+        return messages
+
+
+def adapter_for(lm: dspy.BaseLM | None) -> SourceFirstChatAdapter:
+    """Return the prompt adapter suited to a language model's provider."""
+    model = getattr(lm, "model", "") or ""
+    return _shared_adapter(model.startswith("anthropic/"))
+
+
+@functools.cache
+def _shared_adapter(cache_control: bool) -> SourceFirstChatAdapter:
+    """Share adapters across runs so their rendered system messages persist."""
+    return SourceFirstChatAdapter(cache_control=cache_control)
@@ -0,0 +1,235 @@
+"""
+Offline submission of ensemble prompts through a provider Batch API.
+
+Ensemble runs that do not need answers in real time (dry runs, evaluation
+sweeps) can be submitted as a single batch job instead of live chat
+completions. Providers price batch jobs at roughly half the live rate and
+apply much higher throughput limits. The prompts are rendered with the same
+DSPy adapter used for live calls, so the parsed results are interchangeable.
+
+Only the OpenAI-compatible ``/v1/chat/completions`` batch endpoint is
+supported.
+"""
+
+import io
+import json
+import time
+from typing import Any
+
+import dspy
+from dspy.utils.exceptions import AdapterParseError
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+TERMINAL_BATCH_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchAPIError(Exception):
+    """Raised when a provider batch job cannot be completed."""
+
+    pass
+
+
+def create_batch_client(lm: dspy.LM) -> Any:
+    """
+    Create an OpenAI client pointed at the same endpoint as a DSPy LM.
+
+    Args:
+        lm: The configured DSPy language model
+
+    Returns:
+        An ``openai.OpenAI`` client
+
+    Raises:
+        BatchAPIError: If the ``openai`` package is not installed
+    """
+    try:
+        from openai import OpenAI
+    except ImportError as e:
+        raise BatchAPIError(
+            "The openai package is required for --batch-api submissions"
+        ) from e
+
+    return OpenAI(api_key=lm.kwargs.get("api_key"), base_url=lm.kwargs.get("api_base"))
+
+
+def build_batch_requests(
+    jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+    lm: dspy.LM,
+    adapter: dspy.Adapter | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Render ensemble calls into Batch API request lines.
+
+    Args:
+        jobs: (strategy, temperature, predictor, inputs) for every call
+        lm: The configured DSPy language model
+        adapter: Adapter used to render prompts. Defaults to ``ChatAdapter``.
+
+    Returns:
+        One request dict per job, in job order
+    """
+    adapter = adapter or dspy.ChatAdapter()
+    model = lm.model.split("/", 1)[-1]
+    lm_kwargs = {
+        k: v
+        for k, v in lm.kwargs.items()
+        if k in ("max_tokens", "max_completion_tokens")
+    }
+
+    requests = []
+    for i, (strategy, temp, predictor, inputs) in enumerate(jobs):
+        signature = predictor.predictors()[0].signature
+        messages = adapter.format(signature, demos=[], inputs=inputs)
+        requests.append(
+            {
+                "custom_id": f"{strategy}-{temp}-{i}",
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": model,
+                    "messages": messages,
+                    "temperature": temp,
+                    **lm_kwargs,
+                },
+            }
+        )
+    return requests
+
+
+def submit_batch(client: Any, requests: list[dict[str, Any]]) -> str:
+    """
+    Upload request lines and create a batch job.
+
+    Args:
+        client: An ``openai.OpenAI`` client
+        requests: Request dicts produced by ``build_batch_requests``
+
+    Returns:
+        The provider batch id
+    """
+    payload = "\n".join(json.dumps(r) for r in requests).encode("utf-8")
+    batch_file = client.files.create(
+        file=("ensemble.jsonl", io.BytesIO(payload)), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_file.id,
+        endpoint=BATCH_ENDPOINT,
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    return batch.id
+
+
+def wait_for_batch(
+    client: Any,
+    batch_id: str,
+    poll_interval: float = 30.0,
+    timeout: float | None = None,
+) -> Any:
+    """
+    Poll a batch job until it reaches a terminal status.
+
+    Args:
+        client: An ``openai.OpenAI`` client
+        batch_id: The provider batch id
+        poll_interval: Seconds between status checks
+        timeout: Optional maximum number of seconds to wait
+
+    Returns:
+        The completed batch object
+
+    Raises:
+        BatchAPIError: If the batch fails, expires, is cancelled or times out
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in TERMINAL_BATCH_STATUSES:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            raise BatchAPIError(f"Batch {batch_id} did not finish within {timeout}s")
+        time.sleep(poll_interval)
+
+    if batch.status != "completed":
+        raise BatchAPIError(f"Batch {batch_id} ended with status '{batch.status}'")
+    return batch
+
+
+def collect_batch_results(
+    client: Any,
+    batch: Any,
+    jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+    adapter: dspy.Adapter | None = None,
+) -> list[dspy.Prediction | None]:
+    """
+    Download a finished batch and parse it into DSPy predictions.
+
+    Args:
+        client: An ``openai.OpenAI`` client
+        batch: The completed batch object
+        jobs: The jobs the batch was built from, in the same order
+        adapter: Adapter used to parse completions. Defaults to ``ChatAdapter``.
+
+    Returns:
+        One prediction per job, or None where the request failed or its
+        completion could not be parsed
+    """
+    adapter = adapter or dspy.ChatAdapter()
+
+    completions: dict[str, str] = {}
+    if batch.output_file_id:
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = response.get("body", {}).get("choices") or [{}]
+            completions[record["custom_id"]] = (
+                choices[0].get("message", {}).get("content", "")
+            )
+
+    predictions: list[dspy.Prediction | None] = []
+    for i, (strategy, temp, predictor, _) in enumerate(jobs):
+        completion = completions.get(f"{strategy}-{temp}-{i}")
+        if completion is None:
+            predictions.append(None)
+            continue
+        signature = predictor.predictors()[0].signature
+        try:
+            predictions.append(dspy.Prediction(**adapter.parse(signature, completion)))
+        except AdapterParseError:
+            predictions.append(None)
+    return predictions
+
+
+def run_batch(
+    jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+    lm: dspy.LM,
+    client: Any = None,
+    adapter: dspy.Adapter | None = None,
+    poll_interval: float = 30.0,
+    timeout: float | None = None,
+) -> list[dspy.Prediction | None]:
+    """
+    Submit ensemble jobs as one batch and block until the results are parsed.
+
+    Args:
+        jobs: (strategy, temperature, predictor, inputs) for every call
+        lm: The configured DSPy language model
+        client: Optional pre-built ``openai.OpenAI`` client
+        adapter: Adapter used to render prompts and parse completions.
+            Defaults to the configured DSPy adapter or ``ChatAdapter``.
+        poll_interval: Seconds between status checks
+        timeout: Optional maximum number of seconds to wait
+
+    Returns:
+        One prediction (or None on failure) per job, in job order
+    """
+    client = client or create_batch_client(lm)
+    adapter = adapter or dspy.settings.adapter or dspy.ChatAdapter()
+
+    batch_id = submit_batch(client, build_batch_requests(jobs, lm, adapter))
+    batch = wait_for_batch(client, batch_id, poll_interval, timeout)
+    return collect_batch_results(client, batch, jobs, adapter)
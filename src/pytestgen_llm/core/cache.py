@@ -0,0 +1,161 @@
+"""
+Persistent caching of LLM calls.
+
+Repeated CLI invocations on the same test file send byte-identical prompts to
+the LLM. ``CachingLM`` wraps any DSPy language model with an on-disk,
+exact-match cache so those calls are answered locally without a network
+round-trip.
+
+``CachingPredictor`` caches one level higher, around a strategy's predictor.
+Its key is built from the normalized inputs rather than the rendered prompt,
+so edits that only change whitespace in the test or source file still hit,
+and a hit skips prompt rendering and output parsing as well.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import diskcache
+import dspy
+
+from .signatures import normalize_test_code
+
+DEFAULT_CACHE_DIR = Path("~/.cache/pytestgen-llm").expanduser()
+
+
+class CachingLM(dspy.BaseLM):
+    """
+    DSPy language model wrapper backed by an on-disk exact-match cache.
+
+    The cache key is a SHA-256 digest of the model name, the request
+    parameters (temperature included) and the fully rendered prompt, so a hit
+    is only possible for a request the wrapped model has already answered.
+    """
+
+    def __init__(
+        self, lm: dspy.BaseLM, cache: diskcache.Cache | str | Path | None = None
+    ):
+        """
+        Wrap a language model with a persistent cache.
+
+        Args:
+            lm: The language model that answers cache misses
+            cache: An open ``diskcache.Cache`` or a directory to open one in.
+                Defaults to ``~/.cache/pytestgen-llm``.
+        """
+        super().__init__(model=lm.model, model_type=lm.model_type, **lm.kwargs)
+        self.lm = lm
+        if not isinstance(cache, diskcache.Cache):
+            cache = diskcache.Cache(str(cache or DEFAULT_CACHE_DIR))
+        self.disk_cache = cache
+
+    def cache_key(
+        self,
+        prompt: str | None = None,
+        messages: list[dict[str, Any]] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Compute the cache key for a request."""
+        params = {
+            k: v for k, v in {**self.lm.kwargs, **kwargs}.items() if k != "api_key"
+        }
+        payload = json.dumps(
+            [self.model, params, prompt, messages], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def __call__(self, prompt=None, *, messages=None, **kwargs):
+        """Return cached outputs for a request, calling the wrapped LM on a miss."""
+        key = self.cache_key(prompt, messages, **kwargs)
+        outputs = self.disk_cache.get(key)
+        if outputs is None:
+            outputs = self.lm(prompt, messages=messages, **kwargs)
+            self.disk_cache.set(key, outputs)
+        return outputs
+
+    async def acall(self, prompt=None, *, messages=None, **kwargs):
+        """Async equivalent of ``__call__``."""
+        key = self.cache_key(prompt, messages, **kwargs)
+        outputs = self.disk_cache.get(key)
+        if outputs is None:
+            outputs = await self.lm.acall(prompt, messages=messages, **kwargs)
+            self.disk_cache.set(key, outputs)
+        return outputs
+
+
+class CachingPredictor(dspy.Module):
+    """
+    Predictor wrapper backed by an on-disk cache keyed by normalized inputs.
+
+    The key covers the signature (fields and instructions, so prompt edits
+    invalidate entries), the few-shot demos of every wrapped predictor (so
+    compiling with an optimizer invalidates them too), model, LM settings,
+    per-call config (temperature included) and every input after
+    ``normalize_test_code``.
+    """
+
+    def __init__(self, predictor: dspy.Module, cache: diskcache.Cache):
+        """
+        Wrap a predictor with a persistent cache.
+
+        Args:
+            predictor: The predictor that answers cache misses
+            cache: An open ``diskcache.Cache``
+        """
+        super().__init__()
+        self.predictor = predictor
+        self.disk_cache = cache
+
+    def cache_key(self, config: dict[str, Any] | None = None, **inputs: Any) -> str:
+        """Compute the cache key for a call."""
+        predictors = self.predictor.predictors()
+        signature = predictors[0].signature
+        demos = [
+            demo.toDict() if isinstance(demo, dspy.Example) else demo
+            for predictor in predictors
+            for demo in predictor.demos
+        ]
+        lm = dspy.settings.lm
+        lm_params = {
+            k: v for k, v in getattr(lm, "kwargs", {}).items() if k != "api_key"
+        }
+        normalized = {
+            name: normalize_test_code(value) if isinstance(value, str) else value
+            for name, value in inputs.items()
+        }
+        payload = json.dumps(
+            [
+                signature.signature,
+                signature.instructions,
+                demos,
+                getattr(lm, "model", None),
+                lm_params,
+                config or {},
+                normalized,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return "predict:" + hashlib.blake2b(payload.encode("utf-8")).hexdigest()
+
+    def forward(self, config: dict[str, Any] | None = None, **inputs: Any):
+        """Return the cached prediction, calling the predictor on a miss."""
+        key = self.cache_key(config, **inputs)
+        fields = self.disk_cache.get(key)
+        if fields is None:
+            prediction = self.predictor(**inputs, config=config or {})
+            self.disk_cache.set(key, prediction.toDict())
+            return prediction
+        return dspy.Prediction(**fields)
+
+    async def aforward(self, config: dict[str, Any] | None = None, **inputs: Any):
+        """Async equivalent of ``forward``."""
+        key = self.cache_key(config, **inputs)
+        fields = self.disk_cache.get(key)
+        if fields is None:
+            prediction = await self.predictor.acall(**inputs, config=config or {})
+            self.disk_cache.set(key, prediction.toDict())
+            return prediction
+        return dspy.Prediction(**fields)
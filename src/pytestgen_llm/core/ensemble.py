@@ -1,26 +1,489 @@
 """
-Ensemble test generation module (stub implementation).
+Ensemble test generation module.
+
+This module coordinates the prompt strategies defined in ``signatures`` across
+a sweep of sampling temperatures. Every (strategy, temperature) combination is
+dispatched as a single parallel batch, so an ensemble run completes in roughly
+the latency of its slowest LLM call rather than the sum of all of them.
 """
 
+import asyncio
+from collections.abc import Iterator, Mapping, Sequence
+from itertools import product
+from typing import Any
+
+import diskcache
+import dspy
+
+from ..filters.collection_filter import CollectionFilter
+from ..telemetry import log_telemetry
+from .adapter import adapter_for
+from .batch_api import run_batch
+from .cache import CachingLM, CachingPredictor
+from .signatures import (
+    CornerCasesSignature,
+    ExtendCoverageSignature,
+    ExtendTestSignature,
+    ParsedTest,
+    SignatureValidationError,
+    StatementCompleteSignature,
+    parse_tests,
+    validate_signature_inputs,
+)
+from .streaming import iter_completed_tests, iter_stream_text, stream_listener
+
+# Strategy name -> (signature, output field holding the generated tests)
+STRATEGIES: dict[str, tuple[type[dspy.Signature], str]] = {
+    "extend_coverage": (ExtendCoverageSignature, "new_test_functions"),
+    "corner_cases": (CornerCasesSignature, "corner_case_tests"),
+    "extend_test": (ExtendTestSignature, "extended_tests"),
+    "statement_to_complete": (StatementCompleteSignature, "completed_tests"),
+}
+
+DEFAULT_STRATEGIES = ["extend_coverage", "corner_cases", "extend_test"]
+DEFAULT_TEMPERATURES = [0.0]
+# Concurrent LLM calls of a multi-file batch, unless num_threads is set
+DEFAULT_BATCH_THREADS = 32
 
-class TestGenEnsemble:
+
+class TestGenEnsemble(dspy.Module):
     """
     Main ensemble module for coordinating multiple LLM strategies.
 
-    This is a stub implementation that will be fully developed in Task 1.3.
+    Each requested strategy is run at every requested temperature. All calls
+    are collected up front and fanned out through ``dspy.Parallel`` so that
+    the network round-trips overlap instead of running back to back. One
+    predictor per signature is built at construction and reused by every
+    temperature and every call. Generated tests that do not parse or cannot be
+    collected by pytest are dropped locally, at no LLM cost.
     """
 
-    def __init__(self):
-        # TODO: Initialize strategy predictors
-        pass
+    def __init__(
+        self,
+        num_threads: int | None = None,
+        batch_api: bool = False,
+        cache_dir: str | None = None,
+        prevalidate: bool = True,
+        predictor_cls: type[dspy.Module] | None = None,
+    ):
+        """
+        Initialize the ensemble.
+
+        Args:
+            num_threads: Maximum number of concurrent LLM calls. Defaults to
+                one thread per (strategy, temperature) pair.
+            batch_api: Submit all calls as one provider batch job instead of
+                live requests. Cheaper, but results may take hours.
+            cache_dir: Directory of a persistent cache. When set, calls are
+                answered from disk for inputs (up to whitespace) or prompts
+                seen in earlier runs.
+            prevalidate: Drop generated tests that do not parse or cannot be
+                collected by pytest before they reach later stages.
+            predictor_cls: Module type wrapping each signature, e.g.
+                ``dspy.Predict`` to skip the reasoning step. Defaults to
+                ``dspy.ChainOfThought``.
+        """
+        super().__init__()
+        self.num_threads = num_threads
+        self.batch_api = batch_api
+        self.cache = diskcache.Cache(cache_dir) if cache_dir else None
+        self.collection_filter = CollectionFilter() if prevalidate else None
+
+        # Built once and shared by every call. Named ``generators`` because
+        # ``dspy.Module.predictors()`` is already taken.
+        predictor_cls = predictor_cls or dspy.ChainOfThought
+        self.generators: dict[type[dspy.Signature], dspy.Module] = {
+            signature: predictor_cls(signature) for signature, _ in STRATEGIES.values()
+        }
+        # Cache-backed views of the generators; optimizers still see the
+        # plain predictors above
+        self._cached_generators: dict[type[dspy.Signature], CachingPredictor] = (
+            {
+                signature: CachingPredictor(predictor, self.cache)
+                for signature, predictor in self.generators.items()
+            }
+            if self.cache is not None
+            else {}
+        )
+
+    def get_predictor(self, strategy: str) -> dspy.Module:
+        """
+        Return the predictor that runs a strategy.
+
+        Args:
+            strategy: Strategy name (see ``STRATEGIES``)
+
+        Returns:
+            The shared predictor module for the strategy's signature, wrapped
+            in a ``CachingPredictor`` when a cache directory is configured
+
+        Raises:
+            KeyError: If the strategy is unknown
+        """
+        signature, _ = STRATEGIES[strategy]
+        return self._cached_generators.get(signature) or self.generators[signature]
 
     def forward(
-        self, test_class, source_class=None, strategies=None, temperatures=None
-    ):
+        self,
+        test_class: str,
+        source_class: str | None = None,
+        strategies: list[str] | None = None,
+        temperatures: list[float] | None = None,
+        completion_prompt: str | None = None,
+        min_candidates: int | None = None,
+    ) -> dspy.Prediction:
         """
         Run ensemble generation across multiple strategies and temperatures.
 
-        This is a placeholder that will be implemented in Task 1.3.
+        Strategies whose required inputs are missing (e.g. ``corner_cases``
+        without a source class) are skipped rather than failing the run.
+
+        Args:
+            test_class: Source code of the existing test class
+            source_class: Optional source code of the class under test
+            strategies: Strategy names to run (see ``STRATEGIES``)
+            temperatures: Sampling temperatures to sweep for every strategy
+            completion_prompt: Guidance for the ``statement_to_complete`` strategy
+            min_candidates: Run the temperatures one at a time, in order, and
+                stop once this many validated tests were generated. By default
+                every temperature runs at once.
+
+        Returns:
+            Prediction with ``candidates`` (all parsed test functions) and
+            ``results`` (strategy -> temperature -> test functions)
+
+        Raises:
+            SignatureValidationError: If the inputs fail validation
+            ValueError: If an unknown strategy is requested
+        """
+        jobs = self._plan(
+            test_class, source_class, strategies, temperatures, completion_prompt
+        )
+        lm, adapter = self._lm_and_adapter()
+
+        results: dict[str, dict[float, list[str]]] = {s: {} for s, *_ in jobs}
+        for round_jobs in self._rounds(jobs, min_candidates):
+            outputs = self._execute(round_jobs, lm, adapter)
+            self._collect(round_jobs, outputs, test_class, results)
+            if self._enough(results, min_candidates):
+                break
+
+        return self._prediction(results)
+
+    def batch_generate(
+        self,
+        cases: Sequence[Mapping[str, Any]],
+        strategies: list[str] | None = None,
+        temperatures: list[float] | None = None,
+    ) -> list[dspy.Prediction]:
+        """
+        Run the ensemble over many test files in one fan-out.
+
+        The calls of every case are dispatched together (or submitted as one
+        provider batch), so throughput is bound by the provider rather than by
+        running files one after another.
+
+        Args:
+            cases: Inputs per file, with a ``test_class`` key and optional
+                ``source_class`` and ``completion_prompt`` keys
+            strategies: Strategy names to run for every case
+            temperatures: Sampling temperatures to sweep for every strategy
+
+        Returns:
+            One prediction per case, in order, shaped like ``forward``'s
+
+        Raises:
+            SignatureValidationError: If the inputs of any case fail validation
+            ValueError: If an unknown strategy is requested
+        """
+        planned = [
+            self._plan(
+                case["test_class"],
+                case.get("source_class"),
+                strategies,
+                temperatures,
+                case.get("completion_prompt"),
+            )
+            for case in cases
+        ]
+        jobs = [job for case_jobs in planned for job in case_jobs]
+        lm, adapter = self._lm_and_adapter()
+        outputs = self._execute(
+            jobs,
+            lm,
+            adapter,
+            num_threads=self.num_threads or min(len(jobs), DEFAULT_BATCH_THREADS),
+        )
+
+        predictions = []
+        start = 0
+        for case, case_jobs in zip(cases, planned, strict=True):
+            end = start + len(case_jobs)
+            results: dict[str, dict[float, list[str]]] = {s: {} for s, *_ in case_jobs}
+            self._collect(
+                case_jobs,
+                outputs[start:end],
+                case["test_class"],
+                results,
+            )
+            predictions.append(self._prediction(results))
+            start = end
+        return predictions
+
+    async def aforward(
+        self,
+        test_class: str,
+        source_class: str | None = None,
+        strategies: list[str] | None = None,
+        temperatures: list[float] | None = None,
+        completion_prompt: str | None = None,
+        min_candidates: int | None = None,
+    ) -> dspy.Prediction:
         """
-        # TODO: Implement ensemble generation logic
-        raise NotImplementedError("Ensemble generation not yet implemented")
+        Async version of ``forward``.
+
+        Live calls run concurrently on the event loop. Cancellation propagates;
+        any other failed call is skipped like in ``forward``.
+        """
+        jobs = self._plan(
+            test_class, source_class, strategies, temperatures, completion_prompt
+        )
+        lm, adapter = self._lm_and_adapter()
+
+        results: dict[str, dict[float, list[str]]] = {s: {} for s, *_ in jobs}
+        for round_jobs in self._rounds(jobs, min_candidates):
+            if self.batch_api:
+                outputs = await asyncio.to_thread(
+                    run_batch, round_jobs, lm, adapter=adapter
+                )
+            else:
+                with dspy.context(lm=lm, adapter=adapter):
+                    outputs = await asyncio.gather(
+                        *(
+                            predictor.acall(**call_inputs, config={"temperature": temp})
+                            for _, temp, predictor, call_inputs in round_jobs
+                        ),
+                        return_exceptions=True,
+                    )
+                for o in outputs:
+                    # CancelledError, KeyboardInterrupt: not a failed call
+                    if isinstance(o, BaseException) and not isinstance(o, Exception):
+                        raise o
+                outputs = [None if isinstance(o, Exception) else o for o in outputs]
+            # Collection runs a pytest subprocess; keep the event loop free
+            await asyncio.to_thread(
+                self._collect, round_jobs, outputs, test_class, results
+            )
+            if self._enough(results, min_candidates):
+                break
+
+        return self._prediction(results)
+
+    def stream(
+        self,
+        test_class: str,
+        source_class: str | None = None,
+        strategy: str = "extend_coverage",
+        temperature: float = 0.0,
+        completion_prompt: str | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream test functions from a single strategy as they are generated.
+
+        Each test function is yielded (already syntax-checked) as soon as the
+        LLM has finished writing it, instead of after the whole completion.
+
+        Args:
+            test_class: Source code of the existing test class
+            source_class: Optional source code of the class under test
+            strategy: Strategy name to run (see ``STRATEGIES``)
+            temperature: Sampling temperature
+            completion_prompt: Guidance for the ``statement_to_complete`` strategy
+
+        Yields:
+            Source code of each generated test function
+
+        Raises:
+            SignatureValidationError: If the inputs fail validation
+            ValueError: If the strategy is unknown or lacks its required inputs
+        """
+        jobs = self._plan(
+            test_class, source_class, [strategy], [temperature], completion_prompt
+        )
+        if not jobs:
+            raise ValueError(f"Missing inputs for strategy '{strategy}'")
+
+        _, temp, predictor, call_inputs = jobs[0]
+        field = STRATEGIES[strategy][1]
+        lm, adapter = self._lm_and_adapter()
+
+        program = dspy.streamify(
+            predictor, stream_listeners=[stream_listener(field)], async_streaming=False
+        )
+        with dspy.context(lm=lm, adapter=adapter):
+            stream = program(**call_inputs, config={"temperature": temp})
+            yield from iter_completed_tests(iter_stream_text(stream, field))
+
+    def _plan(
+        self,
+        test_class: str,
+        source_class: str | None,
+        strategies: list[str] | None,
+        temperatures: list[float] | None,
+        completion_prompt: str | None,
+    ) -> list[tuple[str, float, dspy.Module, dict[str, Any]]]:
+        """Validate inputs and expand them into (strategy, temperature) jobs."""
+        strategies = strategies or DEFAULT_STRATEGIES
+        temperatures = temperatures or DEFAULT_TEMPERATURES
+
+        unknown = [s for s in strategies if s not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown strategies: {', '.join(unknown)}")
+
+        inputs = validate_signature_inputs(
+            existing_test_class=test_class,
+            class_under_test=source_class,
+            completion_prompt=completion_prompt,
+        )
+
+        runnable = [s for s in strategies if self._has_required_inputs(s, inputs)]
+        for strategy in strategies:
+            if strategy not in runnable:
+                log_telemetry("generation_skipped", strategy, "missing inputs")
+
+        jobs = []
+        for strategy, temp in product(runnable, temperatures):
+            signature, _ = STRATEGIES[strategy]
+            call_inputs = {
+                name: inputs[name] for name in signature.input_fields if name in inputs
+            }
+            jobs.append((strategy, temp, self.get_predictor(strategy), call_inputs))
+        return jobs
+
+    def _lm_and_adapter(self) -> tuple[dspy.BaseLM | None, dspy.Adapter]:
+        """Resolve the LM (cache-wrapped if enabled) and prompt adapter to use."""
+        lm = dspy.settings.lm
+        if self.cache is not None and lm is not None:
+            lm = CachingLM(lm, self.cache)
+        return lm, dspy.settings.adapter or adapter_for(lm)
+
+    @staticmethod
+    def _rounds(
+        jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+        min_candidates: int | None,
+    ) -> list[list[tuple[str, float, dspy.Module, dict[str, Any]]]]:
+        """Split jobs into rounds: all at once, or per temperature to stop early."""
+        if not jobs:
+            return []
+        if min_candidates is None:
+            return [jobs]
+        temperatures = dict.fromkeys(temp for _, temp, *_ in jobs)
+        return [[job for job in jobs if job[1] == temp] for temp in temperatures]
+
+    @staticmethod
+    def _enough(
+        results: dict[str, dict[float, list[str]]], min_candidates: int | None
+    ) -> bool:
+        """Check whether enough validated tests were generated to stop early."""
+        if min_candidates is None:
+            return False
+        found = sum(
+            len(tests) for by_temp in results.values() for tests in by_temp.values()
+        )
+        return found >= min_candidates
+
+    @staticmethod
+    def _prediction(results: dict[str, dict[float, list[str]]]) -> dspy.Prediction:
+        """Build the ensemble prediction from the result matrix."""
+        candidates = [
+            test
+            for by_temperature in results.values()
+            for tests in by_temperature.values()
+            for test in tests
+        ]
+        return dspy.Prediction(candidates=candidates, results=results)
+
+    def _collect(
+        self,
+        jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+        outputs: list[dspy.Prediction | None],
+        test_class: str,
+        results: dict[str, dict[float, list[str]]],
+    ) -> None:
+        """
+        Parse and pre-validate raw predictions into the result matrix.
+
+        Tests are pre-validated appended to ``test_class``, the existing test
+        module, so they may use its module-level names.
+        """
+        parsed: list[tuple[str, float, list[ParsedTest]]] = []
+        for (strategy, temp, _, _), output in zip(jobs, outputs, strict=True):
+            if output is None:
+                log_telemetry("generation_error", strategy, temp, "LLM call failed")
+                continue
+
+            try:
+                tests = parse_tests(getattr(output, STRATEGIES[strategy][1]))
+            except SignatureValidationError as e:
+                log_telemetry("generation_error", strategy, temp, str(e))
+                continue
+            parsed.append((strategy, temp, tests))
+
+        if self.collection_filter is not None:
+            # One pytest run validates the tests of every job in the round
+            valid = set(
+                self.collection_filter.filter_batch(
+                    [test for *_, tests in parsed for test in tests], test_class
+                )
+            )
+            for strategy, temp, tests in parsed:
+                rejected = sum(test not in valid for test in tests)
+                if rejected:
+                    log_telemetry("prevalidation_rejected", strategy, temp, rejected)
+            parsed = [
+                (strategy, temp, [test for test in tests if test in valid])
+                for strategy, temp, tests in parsed
+            ]
+
+        for strategy, temp, tests in parsed:
+            results[strategy][temp] = [test.source for test in tests]
+            log_telemetry("generation_success", strategy, temp, len(tests))
+
+    def _execute(
+        self,
+        jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+        lm: dspy.BaseLM | None,
+        adapter: dspy.Adapter,
+        num_threads: int | None = None,
+    ) -> list[dspy.Prediction | None]:
+        """Run jobs as one provider batch or as parallel live calls."""
+        if not jobs:
+            return []
+        if self.batch_api:
+            return run_batch(jobs, lm, adapter=adapter)
+        with dspy.context(lm=lm, adapter=adapter):
+            return self._run_parallel(jobs, num_threads)
+
+    def _run_parallel(
+        self,
+        jobs: list[tuple[str, float, dspy.Module, dict[str, Any]]],
+        num_threads: int | None = None,
+    ) -> list[dspy.Prediction | None]:
+        """Fan live LLM calls out through ``dspy.Parallel``."""
+        exec_pairs = [
+            (predictor, {**call_inputs, "config": {"temperature": temp}})
+            for _, temp, predictor, call_inputs in jobs
+        ]
+        parallel = dspy.Parallel(
+            num_threads=num_threads or self.num_threads or len(exec_pairs),
+            # A failing strategy must never cancel its siblings
+            max_errors=len(exec_pairs) + 1,
+            disable_progress_bar=True,
+        )
+        return parallel(exec_pairs)
+
+    @staticmethod
+    def _has_required_inputs(strategy: str, inputs: dict[str, Any]) -> bool:
+        """Check that every input field of a strategy's signature is available."""
+        signature, _ = STRATEGIES[strategy]
+        return all(name in inputs for name in signature.input_fields)
@@ -0,0 +1,56 @@
+"""
+Shared HTTP connection pool for LLM calls.
+
+Without a configured client, LiteLLM may open a fresh connection (and TLS
+handshake) for many of the ensemble's parallel requests. ``configure_http_clients``
+installs one pooled sync client as LiteLLM's session, so every threaded call
+reuses warm connections and, when the ``h2`` package is available, multiplexes
+concurrent requests over HTTP/2.
+
+The async session is left to LiteLLM, which keeps its async clients per event
+loop. A process-wide ``httpx.AsyncClient`` would stay bound to the loop that
+first used it and break the next ``asyncio.run``.
+
+Changing LiteLLM's sessions and retry settings is process-wide, so this is
+called once from the application entry point, not by the modules using it.
+"""
+
+import functools
+import importlib.util
+
+import httpx
+
+# Pool size; comfortably above the ensemble's default fan-out
+MAX_CONNECTIONS = 64
+# Retries on transient provider errors, so pooled connections are kept
+NUM_RETRIES = 2
+# Seconds before an LLM request is abandoned
+REQUEST_TIMEOUT = 60.0
+
+
+@functools.cache
+def configure_http_clients() -> httpx.Client:
+    """
+    Install a shared, pooled HTTP client for all synchronous LiteLLM calls.
+
+    Safe to call repeatedly: the client is created and installed once per
+    process.
+
+    Returns:
+        The shared sync client
+    """
+    import litellm
+
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+    )
+    # HTTP/2 needs the optional ``h2`` package; fall back to pooled HTTP/1.1
+    http2 = importlib.util.find_spec("h2") is not None
+    timeout = httpx.Timeout(REQUEST_TIMEOUT)
+
+    client = httpx.Client(http2=http2, limits=limits, timeout=timeout)
+
+    litellm.client_session = client
+    litellm.num_retries = NUM_RETRIES
+    litellm.request_timeout = REQUEST_TIMEOUT
+    return client
@@ -4,15 +4,72 @@ DSPy signatures for test generation strategies.
 This module defines the structured interfaces between the ensemble system and LLMs
 for different test generation strategies. Each signature specifies the input/output
 format and provides validation for the test generation process.
+
+Input fields are declared from most to least stable: the shared source code
+first (``existing_test_class``, then ``class_under_test``) and per-request
+guidance such as ``completion_prompt`` last. Together with
+``SourceFirstChatAdapter`` this keeps the longest possible prompt prefix
+identical across strategies and requests, which provider prompt caches reuse.
 """
 
 import ast
+import functools
+import hashlib
 import re
+from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Any
 
 import dspy
 from pydantic import BaseModel, Field, field_validator
 
+from ..utils.file_utils import dedent_code
+
+# Matches a test function definition; group 1 is the test name
+_TEST_DEF_RE = re.compile(r"def\s+(test_\w+)\s*\(")
+
+# Node types of test functions; pytest-asyncio and anyio tests are async
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Nodes whose bodies can hold tests: compound statements, except clauses and
+# match cases (function bodies are excluded by checking _FUNCTION_DEFS first)
+_TEST_CONTAINERS = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_outcome(code: str) -> tuple[ast.Module | None, tuple | None]:
+    """Parse Python source once; return the tree or the ``SyntaxError`` args."""
+    # ast.parse is a single compile(..., PyCF_ONLY_AST) call; calling compile
+    # directly measured the same, and optimize= does not strip AST docstrings
+    try:
+        return ast.parse(code), None
+    except SyntaxError as e:
+        return None, e.args
+
+
+def parse_cached(code: str) -> ast.Module:
+    """
+    Parse Python source, reusing the outcome of an identical earlier parse.
+
+    Validation and extraction often parse the same string; this keeps it to
+    one parse. Failures are remembered too, and re-raised as a fresh
+    ``SyntaxError`` so cached errors do not accumulate tracebacks. The
+    returned tree is shared and must not be mutated.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        The module's syntax tree
+
+    Raises:
+        SyntaxError: If the code is not valid Python
+    """
+    tree, error = _parse_outcome(code)
+    if error is not None:
+        raise SyntaxError(*error)
+    return tree
+
 
 class SignatureValidationError(Exception):
     """Raised when signature input validation fails."""
@@ -20,6 +77,106 @@ class SignatureValidationError(Exception):
     pass
 
 
+@dataclass(frozen=True, slots=True)
+class ParsedTest:
+    """
+    Test source together with its syntax tree, parsed once.
+
+    Extraction, name lookup and pre-validation all need the tree of the same
+    candidate; passing this around instead of the raw string avoids parsing
+    it again at every step. Trees are shared and must not be mutated.
+
+    Attributes:
+        source: The test code as given (methods keep their indentation)
+        tree: Module holding the parsed code
+        test_defs: Test functions in the code, in order of appearance
+    """
+
+    source: str
+    tree: ast.Module
+    test_defs: tuple[ast.FunctionDef | ast.AsyncFunctionDef, ...]
+
+    @classmethod
+    def of(cls, source: str) -> "ParsedTest":
+        """
+        Parse test code; indented code such as a method is dedented first.
+
+        Raises:
+            SyntaxError: If the code is not valid Python
+        """
+        tree = parse_cached(dedent_code(source))
+        return cls(source, tree, _test_defs(tree))
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the first test function.
+
+        Raises:
+            SignatureValidationError: If the code defines no test function
+        """
+        if not self.test_defs:
+            raise SignatureValidationError("Could not extract test function name")
+        return self.test_defs[0].name
+
+
+def _test_defs(tree: ast.Module) -> tuple[ast.FunctionDef | ast.AsyncFunctionDef, ...]:
+    """Collect the tests of a module, in order (see ``_iter_test_defs``)."""
+    return tuple(_iter_test_defs(tree))
+
+
+def _iter_test_defs(node: ast.AST) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """
+    Yield the tests under a node, in order of appearance.
+
+    Tests are ``test_*`` functions, sync or async, at module level or in
+    classes (nested ones included), also under ``if``, ``try`` or ``with``
+    blocks. Function bodies are not entered: definitions nested inside a
+    test are not separate tests.
+    """
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, _FUNCTION_DEFS):
+            if child.name.startswith("test_"):
+                yield child
+        elif isinstance(child, _TEST_CONTAINERS):
+            yield from _iter_test_defs(child)
+
+
+def _validate_code(code: str) -> str:
+    """
+    Check that code is non-empty, valid Python.
+
+    Plain-function equivalent of ``CodeInput`` for internal hot paths, which
+    need the checks but not a model instance.
+
+    Args:
+        code: Python source code
+
+    Returns:
+        The unchanged code
+
+    Raises:
+        ValueError: If the code is empty or has invalid syntax
+    """
+    _parse_valid(code)
+    return code
+
+
+def _parse_valid(code: str) -> ast.Module:
+    """
+    Run the ``_validate_code`` checks and return the (shared) syntax tree.
+
+    Raises:
+        ValueError: If the code is empty or has invalid syntax
+    """
+    if not code or not code.strip():
+        raise ValueError("Code cannot be empty or whitespace only")
+    try:
+        return parse_cached(code)
+    except SyntaxError as e:
+        raise ValueError(f"Invalid Python syntax: {e}")
+
+
 class CodeInput(BaseModel):
     """Pydantic model for validating test code inputs."""
 
@@ -29,20 +186,8 @@ class CodeInput(BaseModel):
     @field_validator("code")
     @classmethod
     def validate_python_syntax(cls, v: str) -> str:
-        """Validate that the code has valid Python syntax."""
-        try:
-            ast.parse(v)
-            return v
-        except SyntaxError as e:
-            raise ValueError(f"Invalid Python syntax: {e}")
-
-    @field_validator("code")
-    @classmethod
-    def validate_not_empty(cls, v: str) -> str:
-        """Ensure code is not empty or whitespace only."""
-        if not v.strip():
-            raise ValueError("Code cannot be empty or whitespace only")
-        return v
+        """Validate that the code is non-empty and has valid Python syntax."""
+        return _validate_code(v)
 
 
 class ExtendCoverageSignature(dspy.Signature):
@@ -238,21 +383,20 @@ def validate_signature_inputs(
         SignatureValidationError: If validation fails
     """
     try:
-        # Validate test class
-        test_input = CodeInput(code=existing_test_class, file_type="test")
+        # Validate test class; its tree also answers the test function check
+        tree = _parse_valid(existing_test_class)
 
         # Validate that test class contains test functions
-        if not re.search(r"def\s+test_\w+\s*\(", existing_test_class):
+        if next(_iter_test_defs(tree), None) is None:
             raise SignatureValidationError(
                 "Test class must contain at least one test function (def test_*)"
             )
 
-        validated = {"existing_test_class": test_input.code}
+        validated = {"existing_test_class": existing_test_class}
 
         # Validate source class if provided
         if class_under_test:
-            source_input = CodeInput(code=class_under_test, file_type="source")
-            validated["class_under_test"] = source_input.code
+            validated["class_under_test"] = _validate_code(class_under_test)
 
         # Validate completion prompt if provided
         if completion_prompt:
@@ -276,52 +420,73 @@ def parse_test_functions(generated_output: str) -> list[str]:
     Returns:
         List of individual test function strings
 
+    Raises:
+        SignatureValidationError: If no valid test functions found
+    """
+    return [test.source for test in parse_tests(generated_output)]
+
+
+def parse_tests(generated_output: str) -> list[ParsedTest]:
+    """
+    Extract individual test functions from generated output, with their trees.
+
+    The output is parsed once; each test reuses its function node from that
+    parse instead of being parsed again on its own.
+
+    Args:
+        generated_output: Raw output from LLM containing test functions
+
+    Returns:
+        One ``ParsedTest`` per test function, in order of appearance
+
     Raises:
         SignatureValidationError: If no valid test functions found
     """
     if not generated_output or not generated_output.strip():
         raise SignatureValidationError("Generated output is empty")
 
+    # Normalize line endings so AST line numbers index the split lines
+    source = generated_output.replace("\r\n", "\n").replace("\r", "\n")
+
     # Try to parse as Python to validate syntax
     try:
-        tree = ast.parse(generated_output)
+        tree = parse_cached(source)
     except SyntaxError as e:
         raise SignatureValidationError(
             f"Generated output has invalid Python syntax: {e}"
         )
 
-    # Extract test functions
-    test_functions = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef) and node.name.startswith("test_"):
-            # Extract the function source code
-            lines = generated_output.split("\n")
-            start_line = node.lineno - 1
-
-            # Find the end of the function
-            end_line = start_line + 1
-            while end_line < len(lines) and (
-                lines[end_line].startswith("    ") or lines[end_line].strip() == ""
-            ):
-                end_line += 1
-
-            func_code = "\n".join(lines[start_line:end_line])
-            test_functions.append(func_code)
-
-    if not test_functions:
+    # Slice each function (decorators included) out of the lines split once.
+    # The tree is needed for validation anyway, and its line spans stay exact
+    # where a regex would trip over multi-line signatures or "def test_" text
+    # inside strings.
+    lines = source.split("\n")
+    tests = []
+    for node in _iter_test_defs(tree):
+        decorators = node.decorator_list
+        start_line = decorators[0].lineno if decorators else node.lineno
+        tests.append(
+            ParsedTest(
+                "\n".join(lines[start_line - 1 : node.end_lineno]),
+                ast.Module(body=[node], type_ignores=[]),
+                (node,),
+            )
+        )
+
+    if not tests:
         raise SignatureValidationError(
             "No valid test functions found in generated output"
         )
 
-    return test_functions
+    return tests
 
 
-def extract_test_name(test_function_code: str) -> str:
+def extract_test_name(test_function_code: str | ParsedTest) -> str:
     """
     Extract the test function name from test code.
 
     Args:
-        test_function_code: Source code of a test function
+        test_function_code: Source code of a test function, or its parsed form
 
     Returns:
         The test function name
@@ -329,7 +494,15 @@ def extract_test_name(test_function_code: str) -> str:
     Raises:
         SignatureValidationError: If function name cannot be extracted
     """
-    match = re.search(r"def\s+(test_\w+)\s*\(", test_function_code)
+    if isinstance(test_function_code, ParsedTest):
+        return test_function_code.name
+    return _name_from_source(test_function_code)
+
+
+@functools.lru_cache(maxsize=1024)
+def _name_from_source(test_function_code: str) -> str:
+    """Find the first test name in source; names are looked up repeatedly."""
+    match = _TEST_DEF_RE.search(test_function_code)
     if not match:
         raise SignatureValidationError("Could not extract test function name")
     return match.group(1)
@@ -345,21 +518,32 @@ def normalize_test_code(test_code: str) -> str:
     Returns:
         Normalized version of the test code
     """
-    # Remove leading/trailing whitespace and normalize line endings
+    # Normalize line endings, then drop trailing whitespace. splitlines() would
+    # be faster but also splits on \x0b, \x0c, \x1c-\x1e, \x85, \u2028 and
+    # \u2029, changing string literals that contain them and so fingerprints.
+    # A per-character scanner doing everything in one pass is several times
+    # slower in CPython than these C-level passes over the whole string.
     normalized = test_code.strip().replace("\r\n", "\n").replace("\r", "\n")
+    normalized = "\n".join([line.rstrip() for line in normalized.split("\n")])
+
+    # Collapse runs of blank lines into a single blank line
+    while "\n\n\n" in normalized:
+        normalized = normalized.replace("\n\n\n", "\n\n")
+
+    return normalized
+
+
+def fingerprint_test(normalized_code: str) -> bytes:
+    """
+    Compute a compact duplicate-detection key for normalized test code.
 
-    # Remove extra blank lines
-    lines = [line.rstrip() for line in normalized.split("\n")]
-    normalized_lines = []
-    prev_blank = False
-
-    for line in lines:
-        if line == "":
-            if not prev_blank:
-                normalized_lines.append(line)
-            prev_blank = True
-        else:
-            normalized_lines.append(line)
-            prev_blank = False
-
-    return "\n".join(normalized_lines)
+    Dedup sets can hold these 16-byte digests instead of the full source of
+    every candidate seen.
+
+    Args:
+        normalized_code: Output of ``normalize_test_code``
+
+    Returns:
+        128-bit BLAKE2b digest of the code
+    """
+    return hashlib.blake2b(normalized_code.encode(), digest_size=16).digest()
@@ -0,0 +1,109 @@
+"""
+Incremental extraction of test functions from streamed LLM output.
+
+Waiting for a full completion before showing anything wastes the whole
+generation time. ``iter_completed_tests`` consumes text chunks as they
+arrive and yields each test function as soon as the next test starting at
+column 0 shows that it is finished, so validation and review of the first test overlap
+with generation of the rest.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+import dspy
+
+from .signatures import SignatureValidationError, parse_cached, parse_test_functions
+
+# Column-0 line prefixes that start a new test (a decorator may precede one)
+_TEST_STARTS = ("def test_", "async def test_", "@")
+
+
+def iter_completed_tests(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield complete, syntactically valid test functions from a text stream.
+
+    A block is considered complete when a later line starts a new test or
+    decorator at column 0 and the block parses on its own. Other column-0
+    lines, such as ``else:``, ``except`` or a module-level statement between
+    tests, stay in the current block. What remains at the end of the stream
+    is flushed as a last block. Markdown code fences are ignored.
+
+    Args:
+        chunks: Text fragments in arrival order
+
+    Yields:
+        Source code of each test function, in order of appearance
+    """
+    block: list[str] = []
+    partial = ""
+
+    for chunk in chunks:
+        *lines, partial = (partial + chunk).split("\n")
+        for line in lines:
+            if line.startswith("```"):
+                continue
+            if line.startswith(_TEST_STARTS) and _is_complete(block):
+                yield from _tests_in(block)
+                block = []
+            block.append(line)
+
+    if partial and not partial.startswith("```"):
+        block.append(partial)
+    if _is_complete(block):
+        yield from _tests_in(block)
+
+
+def _is_complete(block: list[str]) -> bool:
+    """Check whether the accumulated lines form a parseable block."""
+    source = "\n".join(block)
+    if not source.strip():
+        return False
+    try:
+        # Shares the parse with the extraction that follows a complete block
+        parse_cached(source)
+    except SyntaxError:
+        return False
+    return True
+
+
+def _tests_in(block: list[str]) -> list[str]:
+    """Extract the test functions of a parseable block, if any."""
+    try:
+        return parse_test_functions("\n".join(block))
+    except SignatureValidationError:
+        return []
+
+
+def iter_stream_text(stream: Iterable[Any], field: str) -> Iterator[str]:
+    """
+    Reduce a ``dspy.streamify`` stream to the text of one output field.
+
+    Cached calls are not streamed, so when no chunk arrives the field value of
+    the final prediction is yielded in one piece instead.
+
+    Args:
+        stream: Items produced by a streamified program
+        field: Output field to extract
+
+    Yields:
+        Text fragments of the field
+    """
+    streamed = False
+    for item in stream:
+        if isinstance(item, dspy.streaming.StreamResponse):
+            if item.signature_field_name == field:
+                streamed = True
+                yield item.chunk
+        elif isinstance(item, dspy.Prediction) and not streamed:
+            yield getattr(item, field, "") or ""
+
+
+def stream_listener(field: str) -> dspy.streaming.StreamListener:
+    """Build a stream listener for an output field of the ensemble adapters."""
+    listener = dspy.streaming.StreamListener(signature_field_name=field)
+    # Listeners look adapters up by class name; ours share ChatAdapter's markers
+    listener.adapter_identifiers.setdefault(
+        "SourceFirstChatAdapter", listener.adapter_identifiers["ChatAdapter"]
+    )
+    return listener
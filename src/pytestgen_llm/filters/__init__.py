@@ -3,6 +3,7 @@ Filtration pipeline modules for test quality assurance.
 """
 
 from .base_filter import BaseFilter
+from .collection_filter import CollectionFilter
 from .pipeline import FilterPipeline
 
-__all__ = ["BaseFilter", "FilterPipeline"]
+__all__ = ["BaseFilter", "CollectionFilter", "FilterPipeline"]
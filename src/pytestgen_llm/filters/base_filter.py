@@ -1,18 +1,30 @@
 """
-Base filter class for the filtration pipeline (stub implementation).
+Base filter interface for the filtration pipeline.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
+from abc import abstractmethod
+from typing import Any, Protocol, runtime_checkable
 
 
-class BaseFilter(ABC):
+@runtime_checkable
+class BaseFilter(Protocol):
     """
-    Abstract base class for all filtration pipeline filters.
+    Interface of all filtration pipeline filters.
 
-    This is a stub implementation that will be fully developed in Task 1.4.
+    Any object with a ``cost`` and ``filter`` and ``get_filter_name`` methods
+    is a filter. Subclassing is optional: it inherits the default cost and
+    refuses to instantiate until both methods are implemented. Filters declare
+    ``__slots__`` so instances carry no per-instance ``__dict__``.
+
+    ``cost`` is the filter's relative expense per candidate, used by
+    ``FilterPipeline`` to run cheap filters first: roughly 1 for regex or AST
+    checks, 10 for coverage analysis and 100 for anything that runs pytest.
     """
 
+    __slots__ = ()
+
+    cost: int = 1
+
     @abstractmethod
     def filter(self, candidate_test: str) -> Any | None:
         """
@@ -24,9 +36,9 @@ class BaseFilter(ABC):
         Returns:
             The test case if it passes the filter, None if it fails
         """
-        pass
+        ...
 
     @abstractmethod
     def get_filter_name(self) -> str:
         """Return the name of this filter for logging purposes."""
-        pass
+        ...
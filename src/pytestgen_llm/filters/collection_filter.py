@@ -0,0 +1,182 @@
+"""
+Cheap local pre-validation of generated tests.
+
+Many LLM generations are syntactically broken or cannot even be collected by
+pytest. ``CollectionFilter`` rejects those with an ``ast`` parse followed by a
+single ``pytest --collect-only`` run, before any expensive stage (test
+execution, coverage, further LLM calls) is spent on them.
+"""
+
+import ast
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ..utils.file_utils import create_temp_test_file, dedent_code, temp_root
+from .base_filter import BaseFilter
+
+if TYPE_CHECKING:
+    from ..core.signatures import ParsedTest
+
+# Seconds allowed for one ``pytest --collect-only`` run
+COLLECT_TIMEOUT = 5.0
+
+# The existing test module, with a test proving that it imports on its own
+_MODULE_FILE = "test_module_check.py"
+_MODULE_CHECK = "test_module_check"
+
+# Function definitions pytest may collect as tests
+_FUNCTION_DEFS = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+
+class CollectionFilter(BaseFilter):
+    """
+    Reject candidate tests that do not parse or cannot be collected by pytest.
+
+    Each candidate is appended to the existing test module, so it can use the
+    module's imports, constants, parametrize data and decorators, and all
+    candidates of a batch are collected by one pytest subprocess. When the
+    module itself cannot be imported in this environment, or pytest times
+    out, collection proves nothing about the candidates and only the ``ast``
+    check is applied.
+    """
+
+    __slots__ = ("timeout",)
+
+    # Starts a pytest subprocess per batch
+    cost = 100
+
+    def __init__(self, timeout: float = COLLECT_TIMEOUT):
+        """
+        Initialize the filter.
+
+        Args:
+            timeout: Seconds allowed for one ``pytest --collect-only`` run
+        """
+        self.timeout = timeout
+
+    def filter(self, candidate_test: str) -> str | None:
+        """
+        Apply this filter to a candidate test case.
+
+        Args:
+            candidate_test: The test case code to validate
+
+        Returns:
+            The test case if it parses and is collected, None otherwise
+        """
+        survivors = self.filter_batch([candidate_test])
+        return survivors[0] if survivors else None
+
+    def filter_batch(
+        self, candidates: list["str | ParsedTest"], test_module: str = ""
+    ) -> list["str | ParsedTest"]:
+        """
+        Keep the candidates that parse and are collected by pytest.
+
+        Args:
+            candidates: Test function source code, possibly indented methods,
+                or ``ParsedTest`` objects, which skip the syntax check
+            test_module: Source of the existing test module each candidate is
+                appended to for collection
+
+        Returns:
+            The surviving candidates, as given, in their original order
+        """
+        named = [(c, names) for c in candidates if (names := _test_names(c))]
+        if not named:
+            return []
+
+        collected = self._collect(named, test_module)
+        if collected is None:
+            return [c for c, _ in named]
+        return [c for (c, _), ok in zip(named, collected, strict=True) if ok]
+
+    def get_filter_name(self) -> str:
+        """Return the name of this filter for logging purposes."""
+        return "collection"
+
+    def _collect(
+        self, named: list[tuple["str | ParsedTest", list[str]]], test_module: str
+    ) -> list[bool] | None:
+        """
+        Run ``pytest --collect-only`` over one file per candidate.
+
+        Returns:
+            Per candidate, whether one of its tests was collected from its
+            file, or None when collection could not judge the candidates
+        """
+        with tempfile.TemporaryDirectory(
+            prefix="pytestgen-collect-", dir=temp_root()
+        ) as tmp:
+            root = Path(tmp)
+            config = root / "pytest.ini"
+            config.write_text("[pytest]\n", encoding="utf-8")
+            module = root / _MODULE_FILE
+            module.write_text(
+                f"{test_module}\n\n\ndef {_MODULE_CHECK}():\n    pass\n",
+                encoding="utf-8",
+            )
+            files = [
+                Path(
+                    create_temp_test_file(
+                        str(module),
+                        c if isinstance(c, str) else c.source,
+                        directory=tmp,
+                    )
+                ).name
+                for c, _ in named
+            ]
+
+            try:
+                result = subprocess.run(
+                    [
+                        sys.executable,
+                        "-m",
+                        "pytest",
+                        "--collect-only",
+                        "-q",
+                        "-p",
+                        "no:cacheprovider",
+                        "-c",
+                        str(config),
+                        "--rootdir",
+                        tmp,
+                        tmp,
+                    ],
+                    capture_output=True,
+                    text=True,
+                    timeout=self.timeout,
+                )
+            except subprocess.TimeoutExpired:
+                return None
+
+        # One "path::[Class::]name[param]" line per collected test
+        collected: set[tuple[str, str]] = set()
+        for line in result.stdout.splitlines():
+            if "::" in line:
+                path, _, name = line.split("[", 1)[0].partition("::")
+                collected.add((Path(path).name, name.rpartition("::")[2]))
+        if (_MODULE_FILE, _MODULE_CHECK) not in collected:
+            return None
+        return [
+            any((file, name) in collected for name in names)
+            for file, (_, names) in zip(files, named, strict=True)
+        ]
+
+
+def _test_names(candidate: "str | ParsedTest") -> list[str]:
+    """Names of a candidate's test functions; empty if it does not parse."""
+    if not isinstance(candidate, str):
+        return [node.name for node in candidate.test_defs]
+    try:
+        tree = ast.parse(dedent_code(candidate))
+    except SyntaxError:
+        return []
+    return [
+        node.name
+        for node in ast.walk(tree)
+        if isinstance(node, _FUNCTION_DEFS) and node.name.startswith("test_")
+    ]
@@ -1,37 +1,94 @@
 """
-Filtration pipeline orchestrator (stub implementation).
+Filtration pipeline orchestrator.
 """
 
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any
 
+from ..telemetry import log_telemetry
 from .base_filter import BaseFilter
 
+# Filters at or above this cost run concurrently across candidates in run_batch
+EXPENSIVE_FILTER_COST = 100
+
 
 class FilterPipeline:
     """
     Orchestrates the 5-stage filtration pipeline.
 
-    This is a stub implementation that will be fully developed in Task 1.4.
+    Filters run cheapest first (by their ``cost``) and the first rejection
+    stops the run, so expensive stages only ever see candidates that passed
+    every cheaper one.
     """
 
-    def __init__(self, filters: list[BaseFilter]):
+    def __init__(self, filters: list[BaseFilter], max_workers: int | None = None):
         """
         Initialize the pipeline with a list of filters.
 
         Args:
-            filters: List of filters to apply in sequence
+            filters: Filters to apply. They are ordered by ascending cost;
+                filters of equal cost keep the given order.
+            max_workers: Candidates checked concurrently by the expensive
+                stages of ``run_batch``. Defaults to the executor's default.
         """
-        self.filters = filters
+        self.filters = sorted(filters, key=lambda f: f.cost)
+        self.max_workers = max_workers
 
     def run_pipeline(self, candidate_test: str) -> Any | None:
         """
         Run a candidate test through all filters in sequence.
 
+        Each filter receives the previous filter's result.
+
         Args:
             candidate_test: The test case code to validate
 
         Returns:
             The test case result if it passes all filters, None if any filter fails
         """
-        # TODO: Implement filtration pipeline logic
-        raise NotImplementedError("Filtration pipeline not yet implemented")
+        return _apply_filters(self.filters, candidate_test)
+
+    def run_batch(self, candidates: Sequence[str]) -> list[Any | None]:
+        """
+        Run many candidate tests through the pipeline.
+
+        Cheap filters run inline. The survivors then go through the expensive
+        filters (``cost >= EXPENSIVE_FILTER_COST``, e.g. pytest runs) in a
+        thread pool. Those filters spend their time in subprocesses, so the
+        checks run in parallel despite the GIL.
+
+        Args:
+            candidates: Test case code to validate
+
+        Returns:
+            One entry per candidate, in order: its pipeline result, or None if
+            any filter rejected it
+        """
+        cheap = [f for f in self.filters if f.cost < EXPENSIVE_FILTER_COST]
+        expensive = [f for f in self.filters if f.cost >= EXPENSIVE_FILTER_COST]
+
+        results = [_apply_filters(cheap, candidate) for candidate in candidates]
+        survivors = [i for i, result in enumerate(results) if result is not None]
+        if not expensive or not survivors:
+            return results
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            checked = executor.map(
+                partial(_apply_filters, expensive), [results[i] for i in survivors]
+            )
+            for i, result in zip(survivors, checked, strict=True):
+                results[i] = result
+        return results
+
+
+def _apply_filters(filters: list[BaseFilter], candidate: Any) -> Any | None:
+    """Chain a candidate through filters, stopping at the first rejection."""
+    result = candidate
+    for candidate_filter in filters:
+        result = candidate_filter.filter(result)
+        if result is None:
+            log_telemetry("filter_rejected", candidate_filter.get_filter_name())
+            return None
+    return result
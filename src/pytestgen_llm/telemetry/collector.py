@@ -1,36 +1,229 @@
 """
-Telemetry collection system (stub implementation).
+Telemetry collection system.
+
+Events are logged from the generation and filtration hot paths, so logging
+must not wait on I/O. ``TelemetryCollector.log_event`` only enqueues the event
+on a ``queue.SimpleQueue``; a background thread drains the queue and appends
+the events to a JSON-lines file in batches.
+
+Events are encoded with ``orjson`` when it is installed, straight to bytes,
+and with the standard library otherwise. ``orjson`` is an optional speed-up:
+it is not a declared dependency and the lock file does not include it. Both
+encoders write compact JSON; they differ only in values JSON cannot represent,
+where ``orjson`` writes ``null`` for NaN and infinities and ``json`` writes
+``NaN`` and ``Infinity``.
 """
 
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from functools import partial
+from pathlib import Path
 from typing import Any
+from weakref import ref
+
+try:
+    import orjson
+except ImportError:  # optional, not a declared dependency
+    orjson = None
+
+# Default telemetry log file
+DEFAULT_TELEMETRY_FILE = Path("~/.pytestgen/telemetry.jsonl").expanduser()
+# Environment variable overriding the default telemetry log file
+TELEMETRY_FILE_ENV = "PYTESTGEN_TELEMETRY_FILE"
+# Most events written per batch
+FLUSH_BATCH_SIZE = 1000
+# Seconds the writer waits for more events before writing a partial batch
+FLUSH_INTERVAL = 0.1
+
+# Queue items that are not events: ask the writer to flush or to stop
+_FLUSH = object()
+_STOP = object()
+_CONTROL = (_FLUSH, _STOP)
 
 
 class TelemetryCollector:
     """
     Collects and stores telemetry data for system optimization.
 
-    This is a stub implementation that will be fully developed in Task 3.1.
+    Each event is written as one JSON object per line with its timestamp (in
+    nanoseconds), type and data. Writing happens on a daemon thread, started
+    by the first event logged in each process (a forked child gets its own);
+    call ``flush`` to wait for pending events and ``close`` to stop the thread.
     """
 
-    def __init__(self):
-        # TODO: Initialize telemetry storage
-        pass
+    def __init__(self, path: str | Path | None = None):
+        """
+        Initialize the collector; its writer thread starts on the first event.
+
+        Args:
+            path: File the events are appended to; missing parent directories
+                are created. Defaults to ``$PYTESTGEN_TELEMETRY_FILE``, read
+                when events are written, else ``~/.pytestgen/telemetry.jsonl``.
+        """
+        self._path = Path(path) if path else None
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            # The writer thread does not survive a fork; the child starts its own
+            os.register_at_fork(after_in_child=partial(_reset_after_fork, ref(self)))
+
+    @property
+    def path(self) -> Path:
+        """File the events are appended to."""
+        if self._path is not None:
+            return self._path
+        return Path(os.environ.get(TELEMETRY_FILE_ENV) or DEFAULT_TELEMETRY_FILE)
+
+    def log_event(self, event_type: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Log a telemetry event without blocking on I/O.
+
+        Only enqueues the call; the event record is built by the writer
+        thread. Positional details are stored under ``"args"``, keyword
+        details under their own names. Values JSON lacks are stored as str.
+
+        Args:
+            event_type: Name of the event, e.g. ``"generation_success"``
+            *args: Positional event details, e.g. strategy and temperature
+            **kwargs: Named event details
+        """
+        if self._thread is None:
+            self._start_writer()
+        self._queue.put_nowait((time.time_ns(), event_type, args, kwargs))
+
+    def flush(self) -> None:
+        """Block until every event logged so far has been written."""
+        if not self._running():
+            return
+        done = threading.Event()
+        self._queue.put_nowait((_FLUSH, done))
+        done.wait()
+
+    def close(self) -> None:
+        """Write the pending events and stop the writer thread."""
+        if self._running():
+            self._queue.put_nowait((_STOP, None))
+            self._thread.join()
+
+    def _running(self) -> bool:
+        """Whether the writer thread is running."""
+        return self._thread is not None and self._thread.is_alive()
 
-    def log_event(self, event_type: str, data: dict[str, Any]) -> None:
+    def _start_writer(self) -> None:
+        """Start the writer thread, once."""
+        with self._lock:
+            if self._thread is not None:
+                return
+            thread = threading.Thread(
+                target=self._drain, name="pytestgen-telemetry", daemon=True
+            )
+            thread.start()
+            self._thread = thread
+
+    def _reset(self) -> None:
         """
-        Log a telemetry event.
+        Drop the writer state inherited from the parent in a forked child.
 
-        This is a stub implementation that will be fully developed in Task 3.1.
+        The parent's writer did not survive the fork and its lock may have been
+        held when it happened, so nothing is reused. Events still queued belong
+        to the parent, which writes them.
         """
-        # TODO: Implement telemetry logging
-        pass
+        self._lock = threading.Lock()
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def _drain(self) -> None:
+        """Writer thread: collect events into batches and append them."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            # Gather until the batch is full, the interval passes or a control
+            # item asks for the events to be written now
+            while len(batch) < FLUSH_BATCH_SIZE and batch[-1][0] not in _CONTROL:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            events = [item for item in batch if item[0] not in _CONTROL]
+            if events:
+                self._write(events)
+            for item in batch:
+                if item[0] is _FLUSH:
+                    item[1].set()
+                elif item[0] is _STOP:
+                    return
 
+    def _write(self, events: list[tuple[int, str, tuple, dict[str, Any]]]) -> None:
+        """Append a batch of events; telemetry failures never reach callers."""
+        lines = []
+        for ts, event_type, args, kwargs in events:
+            event = {
+                "timestamp_ns": ts,
+                "event": event_type,
+                "data": {"args": list(args), **kwargs} if args else kwargs,
+            }
+            # Encode events one by one so a bad event cannot cost the batch
+            try:
+                lines.append(_encode(event))
+            except Exception:
+                # e.g. tuple dict keys, which neither encoder accepts: keep the
+                # event with its data as a repr, or drop it if even that fails
+                try:
+                    lines.append(_encode({**event, "data": repr(event["data"])}))
+                except Exception:
+                    pass
+        if not lines:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "ab") as f:
+                f.write(b"".join(lines))
+        except Exception:
+            # A dead writer thread would leave flush() waiting forever
+            pass
 
-def log_telemetry(event_type: str, *args, **kwargs) -> None:
+
+def _reset_after_fork(collector_ref: "ref[TelemetryCollector]") -> None:
+    """Fork hook: reset the collector in the child, if it still exists."""
+    collector = collector_ref()
+    if collector is not None:
+        collector._reset()
+
+
+def _encode(event: dict[str, Any]) -> bytes:
     """
-    Convenience function for logging telemetry events.
+    Serialize one event as a JSON line; values JSON lacks are stored as str.
 
-    This is a stub implementation that will be fully developed in Task 3.1.
+    Raises:
+        TypeError: If the event has keys neither encoder accepts
+        ValueError: If the event contains a reference cycle
     """
-    # TODO: Implement telemetry logging function
-    pass
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                event,
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+            )
+        except TypeError:
+            # e.g. integers beyond 64 bits, which only json handles
+            pass
+    line = json.dumps(event, default=str, separators=(",", ":"))
+    return (line + "\n").encode("utf-8")
+
+
+# Process-wide collector, flushed at exit; no thread runs until an event is logged
+_DEFAULT = TelemetryCollector()
+atexit.register(_DEFAULT.close)
+
+# Log an event on the process-wide collector; see TelemetryCollector.log_event
+log_telemetry = _DEFAULT.log_event
@@ -2,13 +2,21 @@
 Utility modules for file operations, coverage analysis, and helper functions.
 """
 
-from .coverage_utils import calculate_coverage_delta, measure_baseline_coverage
-from .file_utils import create_temp_test_file, read_file, write_file
+from .coverage_utils import (
+    CoverageMap,
+    calculate_coverage_delta,
+    measure_baseline_coverage,
+    measure_coverage,
+)
+from .file_utils import create_temp_test_file, dedent_code, read_file, write_file
 
 __all__ = [
     "read_file",
     "write_file",
     "create_temp_test_file",
+    "dedent_code",
     "measure_baseline_coverage",
     "calculate_coverage_delta",
+    "measure_coverage",
+    "CoverageMap",
 ]
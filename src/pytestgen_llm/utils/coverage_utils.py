@@ -1,27 +1,227 @@
 """
-Coverage analysis utilities (stub implementation).
+Coverage analysis utilities.
+
+Coverage is measured with ``coverage.py`` in a subprocess and stored as a
+``CoverageMap``: file paths are interned to small integer ids and each file's
+executable and executed lines are packed into one integer bitmap (bit ``n``
+set for line ``n``). Comparing two measurements is then a handful of bitwise
+operations per file, done in C, instead of a Python walk over every line.
+
+Baselines can be memoized in a ``diskcache.Cache``. An entry is keyed by the
+test file's content and reused only while every measured file keeps its
+modification time and size, so edits to the code under test invalidate it.
 """
 
-from typing import Any
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import coverage
+import diskcache
+from coverage.exceptions import CoverageException
+
+from .file_utils import temp_root
+
+# Seconds allowed for one measured pytest run
+COVERAGE_TIMEOUT = 300.0
+
+# Test modules are never measured, only the code they exercise
+_OMIT_PATTERNS = ("*/test_*.py", "*/*_test.py", "*/conftest.py")
+
+
+@dataclass(frozen=True)
+class CoverageMap:
+    """
+    Line coverage of one test run, packed as per-file bitmaps.
+
+    Attributes:
+        file_ids: Measured file path to its index in the bitmap tuples
+        statements: Bitmap of executable lines, per file id
+        executed: Bitmap of executed lines, per file id
+    """
+
+    file_ids: dict[str, int]
+    statements: tuple[int, ...]
+    executed: tuple[int, ...]
+
+    @property
+    def total_statements(self) -> int:
+        """Number of executable lines across all files."""
+        return sum(bits.bit_count() for bits in self.statements)
+
+    @property
+    def total_executed(self) -> int:
+        """Number of executed lines across all files."""
+        return sum(bits.bit_count() for bits in self.executed)
+
 
+def lines_to_bitmap(lines: Iterable[int]) -> int:
+    """Pack line numbers into an integer with bit ``n`` set for line ``n``."""
+    bits = 0
+    for line in lines:
+        bits |= 1 << line
+    return bits
 
-def measure_baseline_coverage(test_file_path: str) -> dict[str, Any]:
+
+def measure_coverage(
+    test_file_path: str,
+    source: str | None = None,
+    file_ids: dict[str, int] | None = None,
+) -> CoverageMap:
+    """
+    Run a test file under ``coverage.py`` and pack the line coverage.
+
+    Test modules, including the one run, are not measured, so added tests
+    only count through the code they exercise. Failing tests still contribute
+    their coverage.
+
+    Args:
+        test_file_path: Test file to run with pytest
+        source: Restrict measurement to this package or directory
+        file_ids: Ids of an earlier measurement (usually the baseline) to keep;
+            files not in it get new ids
+
+    Returns:
+        Line coverage of the run
+
+    Raises:
+        RuntimeError: If the run produced no coverage data
+    """
+    with tempfile.TemporaryDirectory(prefix="pytestgen-cov-", dir=temp_root()) as tmp:
+        data_file = str(Path(tmp) / ".coverage")
+        omit = (*_OMIT_PATTERNS, str(Path(test_file_path).resolve()))
+        command = [
+            sys.executable,
+            "-m",
+            "coverage",
+            "run",
+            f"--data-file={data_file}",
+            "--omit=" + ",".join(omit),
+        ]
+        if source:
+            command.append(f"--source={source}")
+        command += ["-m", "pytest", "-q", "-p", "no:cacheprovider", test_file_path]
+
+        try:
+            subprocess.run(command, capture_output=True, timeout=COVERAGE_TIMEOUT)
+        except subprocess.TimeoutExpired as e:
+            raise RuntimeError(f"Coverage run of {test_file_path} timed out") from e
+        if not Path(data_file).exists():
+            raise RuntimeError(f"Coverage run of {test_file_path} produced no data")
+
+        cov = coverage.Coverage(data_file=data_file)
+        cov.load()
+        return _pack(cov, dict(file_ids or {}))
+
+
+def _pack(cov: coverage.Coverage, file_ids: dict[str, int]) -> CoverageMap:
+    """Convert loaded coverage data to bitmaps, extending ``file_ids``."""
+    data = cov.get_data()
+    measured = sorted(data.measured_files())
+    for path in measured:
+        file_ids.setdefault(path, len(file_ids))
+
+    statements = [0] * len(file_ids)
+    executed = [0] * len(file_ids)
+    for path in measured:
+        lines = data.lines(path) or []
+        try:
+            file_statements = cov.analysis2(path)[1]
+        except CoverageException:
+            # Source no longer readable: executed lines are all that is known
+            file_statements = lines
+        statements[file_ids[path]] = lines_to_bitmap(file_statements)
+        executed[file_ids[path]] = lines_to_bitmap(lines)
+    return CoverageMap(file_ids, tuple(statements), tuple(executed))
+
+
+def measure_baseline_coverage(
+    test_file_path: str,
+    source: str | None = None,
+    cache: diskcache.Cache | str | Path | None = None,
+) -> CoverageMap:
     """
     Measure baseline coverage for a test file.
 
-    This is a stub implementation that will be fully developed in Task 1.6.
+    Args:
+        test_file_path: Existing test file to run with pytest
+        source: Restrict measurement to this package or directory
+        cache: An open ``diskcache.Cache`` or a directory to open one in.
+            When set, an unchanged baseline is returned without running pytest.
+
+    Returns:
+        Line coverage of the existing tests; pass its ``file_ids`` to
+        ``measure_coverage`` so later measurements share the same ids
+
+    Raises:
+        RuntimeError: If the run produced no coverage data
     """
-    # TODO: Implement coverage measurement logic
-    raise NotImplementedError("Coverage measurement not yet implemented")
+    if cache is None:
+        return measure_coverage(test_file_path, source)
+    if isinstance(cache, diskcache.Cache):
+        return _cached_baseline(test_file_path, source, cache)
+    with diskcache.Cache(str(cache)) as opened:
+        return _cached_baseline(test_file_path, source, opened)
+
+
+def _cached_baseline(
+    test_file_path: str, source: str | None, cache: diskcache.Cache
+) -> CoverageMap:
+    """Return the cached baseline if still valid, else measure and store it."""
+    key = _baseline_key(test_file_path, source)
+    entry = cache.get(key)
+    if entry is not None:
+        baseline, stamps = entry
+        if _stamps(baseline.file_ids) == stamps:
+            return baseline
+
+    baseline = measure_coverage(test_file_path, source)
+    cache.set(key, (baseline, _stamps(baseline.file_ids)))
+    return baseline
+
 
+def _baseline_key(test_file_path: str, source: str | None) -> str:
+    """Key a baseline by test file path and content, source and interpreter."""
+    path = Path(test_file_path).resolve()
+    content = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    payload = json.dumps([str(path), content, source, sys.executable])
+    return "baseline_cov:" + hashlib.blake2b(payload.encode("utf-8")).hexdigest()
 
-def calculate_coverage_delta(
-    baseline: dict[str, Any], new_coverage: dict[str, Any]
-) -> float:
+
+def _stamps(paths: Iterable[str]) -> dict[str, tuple[int, int] | None]:
+    """Modification time and size of each file, None for missing files."""
+    stamps = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stamps[path] = None
+        else:
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def calculate_coverage_delta(baseline: CoverageMap, new_coverage: CoverageMap) -> float:
     """
     Calculate the coverage improvement between baseline and new coverage.
 
-    This is a stub implementation that will be fully developed in Task 1.6.
+    Args:
+        baseline: Coverage of the existing tests
+        new_coverage: Coverage with the candidate tests added
+
+    Returns:
+        Lines covered only by the new run, as a fraction of all executable
+        lines it measured (0.0 when nothing new is covered)
     """
-    # TODO: Implement coverage delta calculation
-    raise NotImplementedError("Coverage delta calculation not yet implemented")
+    newly_covered = 0
+    for path, new_id in new_coverage.file_ids.items():
+        base_id = baseline.file_ids.get(path)
+        base = baseline.executed[base_id] if base_id is not None else 0
+        newly_covered += (new_coverage.executed[new_id] & ~base).bit_count()
+    return newly_covered / max(1, new_coverage.total_statements)
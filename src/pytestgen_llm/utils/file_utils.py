@@ -1,9 +1,84 @@
 """
-File I/O and test parsing utilities (stub implementation).
+File I/O and test parsing utilities.
 """
 
+import io
+import os
+import secrets
+import shutil
+import stat
+import tempfile
+import textwrap
+import tokenize
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Directory for temporary test files; ``/dev/shm`` (tmpfs) is recommended on Linux
+TMP_ROOT_ENV = "PYTESTGEN_TMP_ROOT"
+
+
+def temp_root() -> str:
+    """
+    Return the directory that temporary test files are created in.
+
+    Every candidate goes through a create, write and collect cycle; pointing
+    ``PYTESTGEN_TMP_ROOT`` at a tmpfs such as ``/dev/shm`` keeps those files
+    in memory. Read on each call, so the setting can change at runtime.
+
+    Returns:
+        ``$PYTESTGEN_TMP_ROOT`` if set, else the platform temp directory
+    """
+    return os.environ.get(TMP_ROOT_ENV) or tempfile.gettempdir()
+
+
+def dedent_code(code: str) -> str:
+    """
+    Remove the common indentation of code, such as a method taken from a class.
+
+    ``textwrap.dedent`` finds no common margin when a triple-quoted string
+    continues at column 0, and leaves such a method indented and unparseable.
+    Here the margin is taken from the first code line and removed from every
+    line except those continuing a string, whose text must stay as written.
+
+    Args:
+        code: Python source code, possibly indented
+
+    Returns:
+        The code starting at column 0 (unchanged if it cannot be tokenized)
+    """
+    dedented = textwrap.dedent(code)
+    first = next((line for line in dedented.splitlines() if line.strip()), "")
+    margin = len(first) - len(first.lstrip())
+    if not margin:
+        return dedented
+
+    try:
+        tokens = list(tokenize.generate_tokens(io.StringIO(code).readline))
+    except (tokenize.TokenError, SyntaxError):
+        return dedented
+    # Rows after the first row of a multi-line string are string contents
+    string_rows: set[int] = set()
+    fstring_starts: list[int] = []
+    for token in tokens:
+        if token.type == tokenize.FSTRING_START:
+            fstring_starts.append(token.start[0])
+        elif token.type == tokenize.FSTRING_END:
+            string_rows.update(range(fstring_starts.pop() + 1, token.end[0] + 1))
+        elif token.type == tokenize.STRING:
+            string_rows.update(range(token.start[0] + 1, token.end[0] + 1))
+
+    lines = code.splitlines(keepends=True)
+    for row, line in enumerate(lines, start=1):
+        if row not in string_rows:
+            indent = len(line) - len(line.lstrip(" \t"))
+            lines[row - 1] = line[min(indent, margin) :]
+    return "".join(lines)
+
 
 def read_file(file_path: str) -> str:
     """
@@ -19,21 +94,126 @@ def read_file(file_path: str) -> str:
 
 def write_file(file_path: str, content: str) -> None:
     """
-    Write file contents with atomic writing capabilities.
+    Write file contents atomically.
 
-    This is a stub implementation that will be fully developed in Task 1.5.
+    The content is written and fsynced to a temporary file next to the target,
+    which then replaces the target in a single rename; the directory is fsynced
+    so the rename itself survives a crash. A crash mid-write leaves either the
+    old or the new file, never a truncated one. An existing file's permissions
+    are kept, and a symlink is written through: its target is replaced, not
+    the link.
+
+    Args:
+        file_path: Path of the file to write; missing parent directories
+            are created
+        content: Text to write (UTF-8)
+
+    Raises:
+        OSError: If the file cannot be written
     """
+    path = Path(os.path.realpath(file_path))
+    tmp_path = None
     try:
-        Path(file_path).write_text(content, encoding="utf-8")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = _create_sibling(path)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+        _fsync_directory(path.parent)
     except Exception as e:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
         raise OSError(f"Could not write file {file_path}: {e}")
 
 
-def create_temp_test_file(original_file: str, candidate_test: str) -> str:
+def _fsync_directory(directory: Path) -> None:
+    """Flush changes to a directory's entries, such as a rename, to disk."""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Windows: directories cannot be opened for fsync
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _create_sibling(path: Path) -> tuple[int, str]:
     """
-    Create a temporary test file for safe testing.
+    Create a new, uniquely named hidden file next to ``path`` for writing.
 
-    This is a stub implementation that will be fully developed in Task 1.5.
+    Unlike ``tempfile.mkstemp``, which creates owner-only files, the file is
+    created with mode 0o666 so the kernel applies the umask, as a plain write
+    of a new file would.
+
+    Returns:
+        The open file descriptor and the file's path
+    """
+    while True:
+        tmp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            continue
+        return fd, str(tmp_path)
+
+
+def create_temp_test_file(
+    original_file: str, candidate_test: str, directory: str | None = None
+) -> str:
     """
-    # TODO: Implement temporary file creation logic
-    raise NotImplementedError("Temporary test file creation not yet implemented")
+    Create a temporary test file holding an existing test module plus a candidate.
+
+    The original is cloned copy-on-write (reflink) where the filesystem
+    supports it, so its bytes are shared rather than copied, and falls back
+    to a regular copy elsewhere. The candidate is then appended to the clone.
+    Hardlinks are never used: appending through one would modify the
+    original. The caller is responsible for removing the returned file.
+
+    Args:
+        original_file: Path of the existing test module
+        candidate_test: Source code of the candidate test, possibly indented
+            (see ``dedent_code``)
+        directory: Directory to create the file in; defaults to ``temp_root()``
+
+    Returns:
+        Path of the temporary file, named ``test_<original stem>_*.py`` so
+        pytest collects it whatever the original's naming convention
+
+    Raises:
+        OSError: If the temporary file cannot be created
+    """
+    original = Path(original_file)
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory or temp_root(),
+            prefix=f"test_{original.stem}_",
+            suffix=".py",
+        )
+        os.close(fd)
+        _clone_file(original, Path(tmp_path))
+        with open(tmp_path, "a", encoding="utf-8") as f:
+            f.write(f"\n\n\n{dedent_code(candidate_test).strip()}\n")
+    except Exception as e:
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+        raise OSError(f"Could not create temporary test file for {original_file}: {e}")
+    return tmp_path
+
+
+def _clone_file(source: Path, target: Path) -> None:
+    """Copy ``source`` over ``target``, as a reflink when the filesystem allows."""
+    if fcntl is not None and hasattr(fcntl, "FICLONE"):
+        try:
+            with open(source, "rb") as src, open(target, "wb") as dst:
+                fcntl.ioctl(dst.fileno(), fcntl.FICLONE, src.fileno())
+            return
+        except OSError:
+            # Not supported here (tmpfs, ext4, cross-device): copy instead
+            pass
+    shutil.copyfile(source, target)
@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration.
+"""
+
+import os
+
+import pytest
+
+from pytestgen_llm.telemetry.collector import TELEMETRY_FILE_ENV
+
+
+@pytest.fixture(autouse=True, scope="session")
+def telemetry_file(tmp_path_factory):
+    """Keep telemetry logged during the test run out of the home directory."""
+    path = tmp_path_factory.mktemp("telemetry") / "telemetry.jsonl"
+    previous = os.environ.get(TELEMETRY_FILE_ENV)
+    os.environ[TELEMETRY_FILE_ENV] = str(path)
+    yield path
+    if previous is None:
+        del os.environ[TELEMETRY_FILE_ENV]
+    else:
+        os.environ[TELEMETRY_FILE_ENV] = previous
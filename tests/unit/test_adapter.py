@@ -0,0 +1,173 @@
+"""
+Tests for the prefix-cache friendly prompt adapter.
+"""
+
+from unittest.mock import patch
+
+import dspy
+import pytest
+
+from pytestgen_llm.core.adapter import SourceFirstChatAdapter, adapter_for
+from pytestgen_llm.core.signatures import (
+    CornerCasesSignature,
+    ExtendCoverageSignature,
+    ExtendTestSignature,
+    StatementCompleteSignature,
+)
+
+TEST_CLASS = "def test_add():\n    assert 1 + 1 == 2"
+SOURCE_CLASS = "def add(a, b):\n    return a + b"
+
+
+@pytest.fixture
+def inputs():
+    """Inputs shared by the source-based strategies."""
+    return {"existing_test_class": TEST_CLASS, "class_under_test": SOURCE_CLASS}
+
+
+class TestSourceFirstChatAdapter:
+    """Test message layout of the SourceFirstChatAdapter."""
+
+    def test_source_code_leads_system_message(self, inputs):
+        """Test the system message opens with the source code inputs."""
+        messages = SourceFirstChatAdapter().format(ExtendCoverageSignature, [], inputs)
+        system = messages[0]["content"]
+
+        assert system.index(TEST_CLASS) < system.index(SOURCE_CLASS)
+        assert system.index(SOURCE_CLASS) < system.index("Your input fields are")
+
+    def test_source_code_not_repeated_in_user_message(self, inputs):
+        """Test the source code is only sent once."""
+        messages = SourceFirstChatAdapter().format(ExtendCoverageSignature, [], inputs)
+
+        assert TEST_CLASS not in messages[-1]["content"]
+        assert SOURCE_CLASS not in messages[-1]["content"]
+
+    def test_strategies_share_prompt_prefix(self, inputs):
+        """Test different strategies share the whole source block as prefix."""
+        adapter = SourceFirstChatAdapter()
+        coverage = adapter.format(ExtendCoverageSignature, [], inputs)[0]["content"]
+        corner = adapter.format(CornerCasesSignature, [], inputs)[0]["content"]
+
+        shared = coverage.split("Your input fields are")[0]
+        assert SOURCE_CLASS in shared
+        assert corner.startswith(shared)
+
+    @pytest.mark.parametrize(
+        "signature",
+        [
+            ExtendCoverageSignature,
+            CornerCasesSignature,
+            ExtendTestSignature,
+            StatementCompleteSignature,
+        ],
+    )
+    def test_every_strategy_starts_with_shared_source(self, inputs, signature):
+        """Test each strategy's prompt opens with the same source block."""
+        messages = SourceFirstChatAdapter().format(
+            signature, [], {**inputs, "completion_prompt": "Focus on errors"}
+        )
+        system = messages[0]["content"]
+
+        assert system.startswith(
+            "The source code below is the input for the task that follows."
+        )
+        assert system.index(TEST_CLASS) < system.index("Your input fields are")
+        assert "Focus on errors" not in system
+
+    def test_signature_fields_ordered_by_stability(self):
+        """Test source inputs are declared first and per-request guidance last."""
+        fields = list(StatementCompleteSignature.input_fields)
+
+        assert fields == [
+            "existing_test_class",
+            "class_under_test",
+            "completion_prompt",
+        ]
+
+    def test_other_inputs_stay_in_user_message(self, inputs):
+        """Test per-request inputs remain in the user message."""
+        prompt = "Generate performance tests"
+        messages = SourceFirstChatAdapter().format(
+            StatementCompleteSignature, [], {**inputs, "completion_prompt": prompt}
+        )
+
+        assert prompt in messages[-1]["content"]
+        assert prompt not in messages[0]["content"]
+
+    def test_cache_control_marks_source_block(self, inputs):
+        """Test the Anthropic cache marker is set on the source block only."""
+        messages = SourceFirstChatAdapter(cache_control=True).format(
+            ExtendCoverageSignature, [], inputs
+        )
+        source_block, instructions = messages[0]["content"]
+
+        assert source_block["cache_control"] == {"type": "ephemeral"}
+        assert SOURCE_CLASS in source_block["text"]
+        assert "cache_control" not in instructions
+
+    def test_system_message_rendered_once_per_signature(self):
+        """Test the static system message is memoized per signature."""
+        adapter = SourceFirstChatAdapter()
+        first = adapter.format_system_message(ExtendCoverageSignature)
+
+        assert adapter.format_system_message(ExtendCoverageSignature) is first
+
+    def test_repeated_format_renders_once(self, inputs):
+        """Test identical calls reuse the memoized rendering."""
+        adapter = SourceFirstChatAdapter()
+        with patch.object(
+            dspy.ChatAdapter,
+            "format",
+            autospec=True,
+            side_effect=dspy.ChatAdapter.format,
+        ) as render:
+            first = adapter.format(ExtendCoverageSignature, [], inputs)
+            second = adapter.format(ExtendCoverageSignature, [], inputs)
+
+        assert render.call_count == 1
+        assert first == second
+
+    def test_cached_messages_are_copies(self, inputs):
+        """Test mutating returned messages does not corrupt the memo."""
+        adapter = SourceFirstChatAdapter()
+        first = adapter.format(ExtendCoverageSignature, [], inputs)
+        first[0]["content"] = "mutated"
+
+        second = adapter.format(ExtendCoverageSignature, [], inputs)
+        assert second[0]["content"] != "mutated"
+
+    def test_unhashable_inputs_are_rendered(self, inputs):
+        """Test calls with unhashable input values bypass the memo."""
+        messages = SourceFirstChatAdapter().format(
+            ExtendCoverageSignature, [], {**inputs, "extra": ["not", "hashable"]}
+        )
+
+        assert SOURCE_CLASS in messages[0]["content"]
+
+    def test_rendering_type_errors_propagate(self, inputs):
+        """Test a TypeError raised while rendering is not taken as unhashable."""
+        adapter = SourceFirstChatAdapter()
+        with (
+            patch.object(
+                dspy.ChatAdapter, "format", side_effect=TypeError("bad field")
+            ) as render,
+            pytest.raises(TypeError, match="bad field"),
+        ):
+            adapter.format(ExtendCoverageSignature, [], inputs)
+
+        assert render.call_count == 1
+
+
+class TestAdapterFor:
+    """Test adapter selection per provider."""
+
+    def test_anthropic_models_use_cache_control(self):
+        """Test Anthropic models get explicit cache markers."""
+        lm = dspy.LM("anthropic/claude-3-5-haiku-latest")
+        assert adapter_for(lm).cache_control is True
+
+    def test_other_models_rely_on_automatic_caching(self):
+        """Test other providers get plain string messages."""
+        assert adapter_for(dspy.LM("openai/gpt-4o-mini")).cache_control is False
+        assert adapter_for(None).cache_control is False
@@ -0,0 +1,143 @@
+"""
+Tests for provider Batch API submission of ensemble prompts.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import dspy
+import pytest
+
+from pytestgen_llm.core.batch_api import (
+    BatchAPIError,
+    build_batch_requests,
+    collect_batch_results,
+    run_batch,
+    wait_for_batch,
+)
+from pytestgen_llm.core.signatures import ExtendTestSignature
+
+TEST_CLASS = """
+def test_add():
+    assert 1 + 1 == 2
+"""
+
+COMPLETION = (
+    "[[ ## reasoning ## ]]\nCover subtraction.\n\n"
+    "[[ ## extended_tests ## ]]\ndef test_sub():\n    assert 2 - 1 == 1\n\n"
+    "[[ ## completed ## ]]"
+)
+
+
+@pytest.fixture
+def lm():
+    """A DSPy LM that is never called directly."""
+    return dspy.LM("openai/gpt-4o-mini", max_tokens=1000)
+
+
+@pytest.fixture
+def jobs():
+    """Two extend_test jobs at different temperatures."""
+    predictor = dspy.ChainOfThought(ExtendTestSignature)
+    inputs = {"existing_test_class": TEST_CLASS}
+    return [
+        ("extend_test", 0.0, predictor, inputs),
+        ("extend_test", 0.5, predictor, inputs),
+    ]
+
+
+def _output_line(custom_id, content, status_code=200):
+    """Build one line of a Batch API output file."""
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "response": {
+                "status_code": status_code,
+                "body": {"choices": [{"message": {"content": content}}]},
+            },
+        }
+    )
+
+
+def _fake_client(output_lines, statuses=("completed",)):
+    """Build a client mock that walks through batch statuses."""
+    client = MagicMock()
+    client.files.create.return_value = SimpleNamespace(id="file-in")
+    client.batches.create.return_value = SimpleNamespace(id="batch-1")
+    client.batches.retrieve.side_effect = [
+        SimpleNamespace(status=status, output_file_id="file-out") for status in statuses
+    ]
+    client.files.content.return_value = SimpleNamespace(text="\n".join(output_lines))
+    return client
+
+
+class TestBuildBatchRequests:
+    """Test rendering of ensemble jobs into batch request lines."""
+
+    def test_one_request_per_job(self, jobs, lm):
+        """Test every job becomes a chat-completions request."""
+        requests = build_batch_requests(jobs, lm)
+
+        assert [r["custom_id"] for r in requests] == [
+            "extend_test-0.0-0",
+            "extend_test-0.5-1",
+        ]
+        assert all(r["url"] == "/v1/chat/completions" for r in requests)
+
+    def test_request_body_carries_model_and_temperature(self, jobs, lm):
+        """Test the provider prefix is stripped and the temperature is kept."""
+        body = build_batch_requests(jobs, lm)[1]["body"]
+
+        assert body["model"] == "gpt-4o-mini"
+        assert body["temperature"] == 0.5
+        assert body["max_tokens"] == 1000
+        assert TEST_CLASS in body["messages"][-1]["content"]
+
+
+class TestCollectBatchResults:
+    """Test parsing of batch output files."""
+
+    def test_results_are_parsed_in_job_order(self, jobs):
+        """Test completions map back onto their jobs."""
+        client = _fake_client([_output_line("extend_test-0.5-1", COMPLETION)])
+        batch = SimpleNamespace(output_file_id="file-out")
+
+        results = collect_batch_results(client, batch, jobs)
+
+        assert results[0] is None
+        assert "def test_sub" in results[1].extended_tests
+
+    def test_failed_requests_yield_none(self, jobs):
+        """Test non-200 responses are reported as missing."""
+        client = _fake_client([_output_line("extend_test-0.0-0", COMPLETION, 429)])
+        batch = SimpleNamespace(output_file_id="file-out")
+
+        assert collect_batch_results(client, batch, jobs) == [None, None]
+
+
+class TestRunBatch:
+    """Test the end-to-end batch submission flow."""
+
+    def test_polls_until_completed(self, jobs, lm):
+        """Test the batch is polled until it finishes and then parsed."""
+        client = _fake_client(
+            [
+                _output_line("extend_test-0.0-0", COMPLETION),
+                _output_line("extend_test-0.5-1", COMPLETION),
+            ],
+            statuses=("validating", "in_progress", "completed"),
+        )
+
+        results = run_batch(jobs, lm, client=client, poll_interval=0)
+
+        assert client.batches.retrieve.call_count == 3
+        assert client.files.create.call_args.kwargs["purpose"] == "batch"
+        assert all("def test_sub" in r.extended_tests for r in results)
+
+    def test_failed_batch_raises_error(self):
+        """Test a batch ending in a non-completed state raises an error."""
+        client = _fake_client([], statuses=("expired",))
+
+        with pytest.raises(BatchAPIError, match="expired"):
+            wait_for_batch(client, "batch-1", poll_interval=0)
@@ -0,0 +1,138 @@
+"""
+Tests for the persistent LLM call cache.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import diskcache
+import dspy
+import pytest
+
+from pytestgen_llm.core.cache import CachingLM, CachingPredictor
+from pytestgen_llm.core.signatures import ExtendTestSignature
+
+
+@pytest.fixture
+def base_lm():
+    """An LM stand-in that records every call."""
+    lm = MagicMock()
+    lm.model = "openai/gpt-4o-mini"
+    lm.model_type = "chat"
+    lm.kwargs = {"temperature": 0.0, "max_tokens": 1000}
+    lm.return_value = ["def test_generated():\n    assert True"]
+    return lm
+
+
+@pytest.fixture
+def caching_lm(base_lm, tmp_path):
+    """A CachingLM storing its entries in a temporary directory."""
+    return CachingLM(base_lm, tmp_path / "cache")
+
+
+MESSAGES = [{"role": "user", "content": "Write a test"}]
+
+
+class TestCachingLM:
+    """Test cache hits and misses of the CachingLM wrapper."""
+
+    def test_repeated_request_hits_cache(self, caching_lm, base_lm):
+        """Test an identical request is answered without calling the LM."""
+        first = caching_lm(messages=MESSAGES)
+        second = caching_lm(messages=MESSAGES)
+
+        assert first == second == base_lm.return_value
+        assert base_lm.call_count == 1
+
+    def test_temperature_is_part_of_key(self, caching_lm, base_lm):
+        """Test the same prompt at another temperature is a cache miss."""
+        caching_lm(messages=MESSAGES, temperature=0.0)
+        caching_lm(messages=MESSAGES, temperature=0.5)
+
+        assert base_lm.call_count == 2
+
+    def test_prompt_is_part_of_key(self, caching_lm, base_lm):
+        """Test a different prompt is a cache miss."""
+        caching_lm(messages=MESSAGES)
+        caching_lm(messages=[{"role": "user", "content": "Write two tests"}])
+
+        assert base_lm.call_count == 2
+
+    def test_cache_persists_across_instances(self, base_lm, tmp_path):
+        """Test a new wrapper over the same directory reuses earlier answers."""
+        CachingLM(base_lm, tmp_path / "cache")(messages=MESSAGES)
+        CachingLM(base_lm, tmp_path / "cache")(messages=MESSAGES)
+
+        assert base_lm.call_count == 1
+
+    def test_api_key_is_not_part_of_key(self, caching_lm):
+        """Test credentials never influence (or leak into) the cache key."""
+        assert caching_lm.cache_key(messages=MESSAGES) == caching_lm.cache_key(
+            messages=MESSAGES, api_key="secret"
+        )
+
+
+TEST_CLASS = "def test_existing():\n    assert True"
+
+
+@pytest.fixture
+def base_predictor():
+    """A predictor stand-in that records every call."""
+    predictor = MagicMock()
+    predictor.predictors.return_value = [
+        SimpleNamespace(signature=ExtendTestSignature, demos=[])
+    ]
+    predictor.return_value = dspy.Prediction(extended_tests="def test_new(): pass")
+    predictor.acall = AsyncMock(return_value=predictor.return_value)
+    return predictor
+
+
+@pytest.fixture
+def caching_predictor(base_predictor, tmp_path):
+    """A CachingPredictor storing its entries in a temporary directory."""
+    return CachingPredictor(base_predictor, diskcache.Cache(str(tmp_path / "cache")))
+
+
+class TestCachingPredictor:
+    """Test cache hits and misses of the CachingPredictor wrapper."""
+
+    def test_whitespace_only_changes_hit_cache(self, caching_predictor, base_predictor):
+        """Test inputs that normalize identically share one cache entry."""
+        first = caching_predictor(existing_test_class=TEST_CLASS)
+        second = caching_predictor(existing_test_class=f"\n{TEST_CLASS}   \n\n")
+
+        assert second.extended_tests == first.extended_tests
+        assert base_predictor.call_count == 1
+
+    def test_temperature_is_part_of_key(self, caching_predictor, base_predictor):
+        """Test the same inputs at another temperature are a cache miss."""
+        caching_predictor(existing_test_class=TEST_CLASS, config={"temperature": 0.0})
+        caching_predictor(existing_test_class=TEST_CLASS, config={"temperature": 0.5})
+
+        assert base_predictor.call_count == 2
+
+    def test_code_changes_miss_cache(self, caching_predictor, base_predictor):
+        """Test a real change to the inputs is a cache miss."""
+        caching_predictor(existing_test_class=TEST_CLASS)
+        caching_predictor(existing_test_class=TEST_CLASS.replace("True", "False"))
+
+        assert base_predictor.call_count == 2
+
+    def test_demo_changes_miss_cache(self, caching_predictor, base_predictor):
+        """Test compiling new demos into the predictor is a cache miss."""
+        caching_predictor(existing_test_class=TEST_CLASS)
+        base_predictor.predictors()[0].demos = [
+            dspy.Example(existing_test_class=TEST_CLASS, extended_tests="x")
+        ]
+        caching_predictor(existing_test_class=TEST_CLASS)
+
+        assert base_predictor.call_count == 2
+
+    def test_async_calls_share_the_cache(self, caching_predictor, base_predictor):
+        """Test acall is answered from entries stored by sync calls."""
+        caching_predictor(existing_test_class=TEST_CLASS)
+        result = asyncio.run(caching_predictor.acall(existing_test_class=TEST_CLASS))
+
+        assert result.extended_tests == "def test_new(): pass"
+        base_predictor.acall.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Tests for the command-line interface.
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from pytestgen_llm.cli.main import build_parser, main
+
+
+class TestArgumentParser:
+    """Test parsing of command-line arguments."""
+
+    def test_defaults(self):
+        """Test options default to a plain single-strategy run."""
+        args = build_parser().parse_args([])
+
+        assert args.test_file is None
+        assert args.ensemble is False
+        assert args.output_format == "diff"
+
+    def test_flags_and_paths(self, tmp_path):
+        """Test flags and existing paths are parsed."""
+        test_file = tmp_path / "test_user.py"
+        test_file.write_text("def test_user():\n    pass\n")
+
+        args = build_parser().parse_args(
+            ["--test-file", str(test_file), "--ensemble", "--batch-api", "-v"]
+        )
+
+        assert args.test_file == str(test_file)
+        assert args.ensemble and args.batch_api and args.verbose
+
+    def test_missing_path_is_rejected(self, capsys):
+        """Test a nonexistent test file exits with a usage error."""
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(["--test-file", "does/not/exist.py"])
+
+        assert "does not exist" in capsys.readouterr().err
+
+
+class TestMain:
+    """Test the CLI entry point."""
+
+    def test_without_test_file_prints_examples(self, capsys):
+        """Test running without a test file shows usage examples."""
+        main([])
+
+        assert "No test file specified" in capsys.readouterr().out
+
+    def test_run_installs_http_clients(self, tmp_path):
+        """Test the entry point, not the modules, installs the LLM connection pool."""
+        test_file = tmp_path / "test_user.py"
+        test_file.write_text("def test_user():\n    pass\n")
+
+        with patch("pytestgen_llm.core.http.configure_http_clients") as configure:
+            main(["--test-file", str(test_file)])
+
+        configure.assert_called_once_with()
+
+    def test_help_skips_heavy_imports(self):
+        """Test --help neither imports rich nor DSPy."""
+        code = (
+            "import sys\n"
+            "from pytestgen_llm.cli.main import main\n"
+            "try:\n"
+            "    main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('rich' in sys.modules, 'dspy' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.splitlines()[-1] == "False False"
@@ -0,0 +1,119 @@
+"""
+Tests for local pre-validation of generated tests.
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+from pytestgen_llm.core.signatures import parse_test_functions, parse_tests
+from pytestgen_llm.filters import CollectionFilter
+
+VALID_TEST = "def test_ok():\n    assert True\n"
+METHOD_TEST = "    def test_method(self):\n        assert True\n"
+BROKEN_TEST = "def test_broken(:\n    pass\n"
+NOT_A_TEST = "def helper():\n    return 1\n"
+NAME_ERROR_TEST = "@undefined_marker\ndef test_marked():\n    pass\n"
+
+
+class TestCollectionFilter:
+    """Test the AST and pytest collection gate."""
+
+    def test_rejects_unparseable_and_uncollectable(self):
+        """Test broken, non-test and failing-import candidates are dropped."""
+        candidates = [VALID_TEST, BROKEN_TEST, NOT_A_TEST, NAME_ERROR_TEST]
+
+        assert CollectionFilter().filter_batch(candidates) == [VALID_TEST]
+
+    def test_indented_methods_are_accepted(self):
+        """Test methods extracted from a test class are validated dedented."""
+        assert CollectionFilter().filter(METHOD_TEST) == METHOD_TEST
+
+    def test_methods_with_column_zero_strings_are_accepted(self):
+        """Test a method whose string continues at column 0 is not rejected."""
+        methods = parse_test_functions(
+            "class TestGenerated:\n"
+            "    def test_first(self):\n"
+            "        assert True\n"
+            "\n"
+            "    def test_second(self):\n"
+            '        text = """line one\n'
+            'line two"""\n'
+            '        assert text.startswith("line")\n'
+        )
+
+        assert CollectionFilter().filter_batch(methods) == methods
+
+    def test_module_imports_make_candidates_collectable(self):
+        """Test the existing module supplies imports used at collection time."""
+        candidate = "@pytest.mark.slow\ndef test_slow():\n    pass\n"
+
+        assert CollectionFilter().filter(candidate) is None
+        assert CollectionFilter().filter_batch([candidate], "import pytest") == [
+            candidate
+        ]
+
+    def test_module_level_names_are_available(self):
+        """Test candidates may use constants defined in the existing module."""
+        module = (
+            "import pytest\n\nCASES = [1, 2]\n\n\n"
+            "def test_existing():\n    assert True\n"
+        )
+        candidate = (
+            '@pytest.mark.parametrize("x", CASES)\ndef test_cases(x):\n    assert x\n'
+        )
+
+        assert CollectionFilter().filter_batch(
+            [candidate, NAME_ERROR_TEST], module
+        ) == [candidate]
+
+    def test_existing_tests_do_not_vouch_for_candidates(self):
+        """Test a candidate defining no test is rejected next to existing tests."""
+        module = "def test_existing():\n    assert True\n"
+
+        assert CollectionFilter().filter_batch([NOT_A_TEST, VALID_TEST], module) == [
+            VALID_TEST
+        ]
+
+    def test_unimportable_module_falls_back_to_ast(self):
+        """Test collection is skipped when the existing module cannot be imported."""
+        survivors = CollectionFilter().filter_batch(
+            [VALID_TEST, BROKEN_TEST], "import no_such_module_xyz"
+        )
+
+        assert survivors == [VALID_TEST]
+
+    def test_timeout_falls_back_to_ast(self):
+        """Test a collection timeout keeps every parseable candidate."""
+        with patch(
+            "subprocess.run", side_effect=subprocess.TimeoutExpired("pytest", 5)
+        ):
+            survivors = CollectionFilter().filter_batch([VALID_TEST, BROKEN_TEST])
+
+        assert survivors == [VALID_TEST]
+
+    def test_parse_failures_skip_pytest(self):
+        """Test pytest is not started when nothing parses into a test."""
+        with patch("subprocess.run") as run:
+            assert CollectionFilter().filter_batch([BROKEN_TEST, NOT_A_TEST]) == []
+
+        run.assert_not_called()
+
+    def test_parsed_tests_skip_syntax_check(self):
+        """Test ParsedTest candidates are not parsed again and are returned as is."""
+        (test,) = parse_tests(VALID_TEST)
+
+        with patch("ast.parse") as parse:
+            survivors = CollectionFilter().filter_batch([test])
+
+        parse.assert_not_called()
+        assert survivors == [test]
+
+    def test_collects_under_temp_root(self, monkeypatch, tmp_path):
+        """Test candidate files are written under PYTESTGEN_TMP_ROOT."""
+        monkeypatch.setenv("PYTESTGEN_TMP_ROOT", str(tmp_path))
+        with patch("subprocess.run") as run:
+            CollectionFilter().filter_batch([VALID_TEST])
+
+        collect_dir = run.call_args.args[0][-1]
+        assert Path(collect_dir).parent == tmp_path
@@ -0,0 +1,152 @@
+"""
+Tests for coverage measurement and comparison.
+"""
+
+from unittest.mock import patch
+
+import diskcache
+import pytest
+
+from pytestgen_llm.utils import coverage_utils
+from pytestgen_llm.utils.coverage_utils import (
+    CoverageMap,
+    calculate_coverage_delta,
+    lines_to_bitmap,
+    measure_baseline_coverage,
+    measure_coverage,
+)
+
+SOURCE = """
+def classify(n):
+    if n < 0:
+        return "negative"
+    return "non-negative"
+"""
+BASE_TEST = "from calc import classify\n\n\ndef test_positive():\n    classify(1)\n"
+EXTRA_TEST = "\n\ndef test_negative():\n    classify(-1)\n"
+
+
+def _map(**files):
+    """Build a CoverageMap from ``name=(statements, executed)`` line lists."""
+    return CoverageMap(
+        file_ids={name: i for i, name in enumerate(files)},
+        statements=tuple(lines_to_bitmap(s) for s, _ in files.values()),
+        executed=tuple(lines_to_bitmap(e) for _, e in files.values()),
+    )
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A tiny project with a partially covering test file."""
+    (tmp_path / "calc.py").write_text(SOURCE)
+    (tmp_path / "test_calc.py").write_text(BASE_TEST)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestCalculateCoverageDelta:
+    """Test comparison of packed coverage."""
+
+    def test_newly_covered_lines_over_statements(self):
+        """Test the delta is the share of statements only the new run covers."""
+        baseline = _map(a=([1, 2, 3, 4], [1, 2]))
+        new = _map(a=([1, 2, 3, 4], [1, 2, 3]))
+
+        assert calculate_coverage_delta(baseline, new) == 0.25
+
+    def test_no_new_lines(self):
+        """Test covering the same lines again is no improvement."""
+        baseline = _map(a=([1, 2], [1, 2]))
+
+        assert calculate_coverage_delta(baseline, baseline) == 0.0
+
+    def test_files_matched_by_path_not_id(self):
+        """Test measurements with different file ids are compared per path."""
+        baseline = _map(a=([1, 2], [1]), b=([1, 2], [1, 2]))
+        new = _map(b=([1, 2], [1, 2]), a=([1, 2], [1, 2]))
+
+        assert calculate_coverage_delta(baseline, new) == 0.25
+
+    def test_file_missing_from_baseline(self):
+        """Test every executed line of a newly measured file counts."""
+        baseline = _map(a=([1], [1]))
+        new = _map(a=([1], [1]), b=([1, 2, 3], [1, 2, 3]))
+
+        assert calculate_coverage_delta(baseline, new) == 0.75
+
+
+class TestMeasureCoverage:
+    """Test coverage measurement of a pytest run."""
+
+    def test_added_test_increases_coverage(self, project):
+        """Test an added test covering a new branch yields a positive delta."""
+        baseline = measure_baseline_coverage("test_calc.py", source=str(project))
+        (project / "test_more.py").write_text(BASE_TEST + EXTRA_TEST)
+
+        new = measure_coverage("test_more.py", str(project), baseline.file_ids)
+
+        assert new.file_ids == baseline.file_ids
+        assert new.total_executed == baseline.total_executed + 1
+        assert calculate_coverage_delta(baseline, new) > 0
+
+    def test_test_file_itself_is_not_measured(self, project):
+        """Test only the code under test is measured."""
+        baseline = measure_baseline_coverage("test_calc.py", source=str(project))
+
+        assert [path.endswith("calc.py") for path in baseline.file_ids] == [True]
+        assert not any(path.endswith("test_calc.py") for path in baseline.file_ids)
+
+
+class TestBaselineCache:
+    """Test memoization of baseline coverage."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """An empty on-disk cache."""
+        with diskcache.Cache(str(tmp_path / "cache")) as cache:
+            yield cache
+
+    def _measure(self, project, cache):
+        """Measure the project's baseline through the cache."""
+        return measure_baseline_coverage("test_calc.py", str(project), cache)
+
+    def test_unchanged_baseline_skips_pytest(self, project, cache):
+        """Test a second measurement is answered from the cache."""
+        first = self._measure(project, cache)
+
+        with patch.object(coverage_utils, "measure_coverage") as measure:
+            second = self._measure(project, cache)
+
+        measure.assert_not_called()
+        assert second == first
+
+    def test_cache_directory_is_opened_per_call(self, project, tmp_path):
+        """Test a cache given as a directory persists between calls."""
+        directory = tmp_path / "cache_dir"
+        first = measure_baseline_coverage("test_calc.py", str(project), directory)
+
+        with patch.object(coverage_utils, "measure_coverage") as measure:
+            second = measure_baseline_coverage("test_calc.py", str(project), directory)
+
+        measure.assert_not_called()
+        assert second == first
+
+    def test_source_edit_invalidates(self, project, cache):
+        """Test changing the code under test forces a new measurement."""
+        self._measure(project, cache)
+        (project / "calc.py").write_text(SOURCE + "\n\ndef extra():\n    pass\n")
+
+        with patch.object(
+            coverage_utils, "measure_coverage", wraps=measure_coverage
+        ) as measure:
+            baseline = self._measure(project, cache)
+
+        measure.assert_called_once()
+        assert baseline.total_statements > 4
+
+    def test_test_edit_invalidates(self, project, cache):
+        """Test changing the test file is a different cache entry."""
+        first = self._measure(project, cache)
+        (project / "test_calc.py").write_text(BASE_TEST + EXTRA_TEST)
+
+        assert self._measure(project, cache).total_executed > first.total_executed
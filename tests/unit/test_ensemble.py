@@ -0,0 +1,312 @@
+"""
+Tests for the TestGenEnsemble orchestration module.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import dspy
+import pytest
+
+from pytestgen_llm.core import ensemble
+from pytestgen_llm.core.signatures import SignatureValidationError
+
+TEST_CLASS = """
+class TestCalculator:
+    def test_add(self):
+        assert 1 + 1 == 2
+"""
+
+SOURCE_CLASS = """
+class Calculator:
+    def add(self, a, b):
+        return a + b
+"""
+
+GENERATED_TESTS = """
+def test_add_negative():
+    assert -1 + -1 == -2
+
+def test_add_zero():
+    assert 0 + 0 == 0
+"""
+
+
+def _fake_predictor(signature):
+    """Build a predictor mock that answers every output field with tests."""
+    predictor = MagicMock(name=signature.__name__)
+    predictor.return_value = dspy.Prediction(
+        **{name: GENERATED_TESTS for name in signature.output_fields}
+    )
+    return predictor
+
+
+@pytest.fixture
+def mock_chain_of_thought():
+    """Replace dspy.ChainOfThought with per-signature predictor mocks."""
+    with patch("dspy.ChainOfThought", side_effect=_fake_predictor) as mock:
+        yield mock
+
+
+class TestEnsembleForward:
+    """Test ensemble fan-out across strategies and temperatures."""
+
+    def test_runs_every_strategy_temperature_pair(self, mock_chain_of_thought):
+        """Test every (strategy, temperature) pair produces candidates."""
+        result = ensemble.TestGenEnsemble()(
+            TEST_CLASS,
+            SOURCE_CLASS,
+            strategies=["extend_coverage", "corner_cases"],
+            temperatures=[0.0, 0.5],
+        )
+
+        assert set(result.results) == {"extend_coverage", "corner_cases"}
+        for by_temperature in result.results.values():
+            assert set(by_temperature) == {0.0, 0.5}
+        assert len(result.candidates) == 2 * 2 * 2
+
+    def test_predictors_built_once(self, mock_chain_of_thought):
+        """Test predictors are built at construction and reused by every call."""
+        test_gen = ensemble.TestGenEnsemble()
+        assert mock_chain_of_thought.call_count == len(ensemble.STRATEGIES)
+
+        for _ in range(2):
+            test_gen(
+                TEST_CLASS,
+                SOURCE_CLASS,
+                strategies=["extend_coverage"],
+                temperatures=[0.0, 0.2, 0.5],
+            )
+
+        assert mock_chain_of_thought.call_count == len(ensemble.STRATEGIES)
+        assert test_gen.generators[ensemble.ExtendCoverageSignature].call_count == 6
+
+    def test_construction_leaves_litellm_settings_alone(self, mock_chain_of_thought):
+        """Test building the module installs no process-wide HTTP clients."""
+        with patch("pytestgen_llm.core.http.configure_http_clients") as configure:
+            ensemble.TestGenEnsemble()
+
+        configure.assert_not_called()
+
+    def test_predictor_cls_replaces_chain_of_thought(self, mock_chain_of_thought):
+        """Test a custom predictor type wraps every signature."""
+        predictor_cls = MagicMock(side_effect=_fake_predictor)
+
+        test_gen = ensemble.TestGenEnsemble(predictor_cls=predictor_cls)
+
+        mock_chain_of_thought.assert_not_called()
+        assert predictor_cls.call_count == len(ensemble.STRATEGIES)
+        assert (
+            test_gen.get_predictor("corner_cases")
+            is (test_gen.generators[ensemble.CornerCasesSignature])
+        )
+
+    def test_cache_dir_wraps_predictors(self, mock_chain_of_thought, tmp_path):
+        """Test a cache directory puts a CachingPredictor in front of each call."""
+        test_gen = ensemble.TestGenEnsemble(cache_dir=str(tmp_path))
+
+        for _ in range(2):
+            test_gen(TEST_CLASS, strategies=["extend_test"])
+
+        assert isinstance(
+            test_gen.get_predictor("extend_test"), ensemble.CachingPredictor
+        )
+        assert test_gen.generators[ensemble.ExtendTestSignature].call_count == 1
+
+    def test_temperature_passed_per_call(self, mock_chain_of_thought):
+        """Test each call carries its own temperature in the predictor config."""
+        predictor = _fake_predictor(ensemble.ExtendTestSignature)
+        mock_chain_of_thought.side_effect = None
+        mock_chain_of_thought.return_value = predictor
+
+        ensemble.TestGenEnsemble()(
+            TEST_CLASS, strategies=["extend_test"], temperatures=[0.0, 0.7]
+        )
+
+        temperatures = sorted(
+            call.kwargs["config"]["temperature"] for call in predictor.call_args_list
+        )
+        assert temperatures == [0.0, 0.7]
+
+    def test_strategies_missing_inputs_are_skipped(self, mock_chain_of_thought):
+        """Test source-dependent strategies are skipped without a source class."""
+        result = ensemble.TestGenEnsemble()(
+            TEST_CLASS, strategies=["extend_coverage", "extend_test"]
+        )
+
+        assert list(result.results) == ["extend_test"]
+
+    def test_failed_call_does_not_abort_ensemble(self, mock_chain_of_thought):
+        """Test one failing strategy leaves the other results intact."""
+
+        def flaky_predictor(signature):
+            predictor = _fake_predictor(signature)
+            if signature is ensemble.CornerCasesSignature:
+                predictor.side_effect = RuntimeError("rate limited")
+            return predictor
+
+        mock_chain_of_thought.side_effect = flaky_predictor
+
+        result = ensemble.TestGenEnsemble()(
+            TEST_CLASS, SOURCE_CLASS, strategies=["extend_coverage", "corner_cases"]
+        )
+
+        assert result.results["corner_cases"] == {}
+        assert len(result.results["extend_coverage"][0.0]) == 2
+
+    def test_uncollectable_tests_are_dropped(self, mock_chain_of_thought):
+        """Test generated tests failing pre-validation never become candidates."""
+        predictor = MagicMock(
+            return_value=dspy.Prediction(
+                extended_tests=GENERATED_TESTS
+                + "\ndef test_broken(x=undefined):\n    pass\n"
+            )
+        )
+        mock_chain_of_thought.side_effect = None
+        mock_chain_of_thought.return_value = predictor
+
+        result = ensemble.TestGenEnsemble()(TEST_CLASS, strategies=["extend_test"])
+
+        assert len(result.candidates) == 2
+        assert not any("test_broken" in test for test in result.candidates)
+
+    def test_min_candidates_stops_after_first_temperature(self, mock_chain_of_thought):
+        """Test later temperatures are skipped once enough tests survive."""
+        test_gen = ensemble.TestGenEnsemble()
+
+        result = test_gen(
+            TEST_CLASS,
+            strategies=["extend_test"],
+            temperatures=[0.0, 0.5, 1.0],
+            min_candidates=2,
+        )
+
+        assert list(result.results["extend_test"]) == [0.0]
+        assert test_gen.generators[ensemble.ExtendTestSignature].call_count == 1
+
+    def test_min_candidates_continues_until_reached(self, mock_chain_of_thought):
+        """Test temperatures keep running while too few tests survive."""
+        test_gen = ensemble.TestGenEnsemble()
+
+        result = test_gen(
+            TEST_CLASS,
+            strategies=["extend_test"],
+            temperatures=[0.0, 0.5, 1.0],
+            min_candidates=3,
+        )
+
+        assert list(result.results["extend_test"]) == [0.0, 0.5]
+        assert len(result.candidates) == 4
+
+    def test_unknown_strategy_raises_error(self):
+        """Test requesting an unknown strategy raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown strategies"):
+            ensemble.TestGenEnsemble()(TEST_CLASS, strategies=["no_such_strategy"])
+
+    def test_invalid_test_class_raises_error(self):
+        """Test invalid inputs are rejected before any LLM call."""
+        with pytest.raises(SignatureValidationError):
+            ensemble.TestGenEnsemble()("def broken(:")
+
+
+class TestEnsembleBatchGenerate:
+    """Test multi-file batch generation."""
+
+    def test_cases_run_in_one_fan_out(self, mock_chain_of_thought):
+        """Test every case's calls are dispatched through one parallel run."""
+        test_gen = ensemble.TestGenEnsemble()
+        cases = [
+            {"test_class": TEST_CLASS, "source_class": SOURCE_CLASS},
+            {"test_class": TEST_CLASS},
+        ]
+
+        with patch.object(
+            test_gen, "_run_parallel", wraps=test_gen._run_parallel
+        ) as run_parallel:
+            predictions = test_gen.batch_generate(
+                cases, strategies=["extend_coverage", "extend_test"]
+            )
+
+        assert run_parallel.call_count == 1
+        assert len(run_parallel.call_args.args[0]) == 3
+        assert set(predictions[0].results) == {"extend_coverage", "extend_test"}
+        assert list(predictions[1].results) == ["extend_test"]
+        assert len(predictions[1].candidates) == 2
+
+    def test_thread_count_is_capped(self, mock_chain_of_thought):
+        """Test large batches do not start one thread per call."""
+        test_gen = ensemble.TestGenEnsemble(prevalidate=False)
+        cases = [{"test_class": TEST_CLASS}] * (ensemble.DEFAULT_BATCH_THREADS + 5)
+
+        with patch("dspy.Parallel", wraps=dspy.Parallel) as parallel:
+            predictions = test_gen.batch_generate(cases, strategies=["extend_test"])
+
+        assert parallel.call_args.kwargs["num_threads"] == (
+            ensemble.DEFAULT_BATCH_THREADS
+        )
+        assert len(predictions) == len(cases)
+
+    def test_invalid_case_raises_error(self):
+        """Test invalid inputs in any case are rejected before LLM calls."""
+        with pytest.raises(SignatureValidationError):
+            ensemble.TestGenEnsemble().batch_generate(
+                [{"test_class": TEST_CLASS}, {"test_class": "def broken(:"}]
+            )
+
+
+def _async_predictor(signature, error=None):
+    """A fake predictor whose ``acall`` returns its result or raises ``error``."""
+    predictor = _fake_predictor(signature)
+    predictor.acall = AsyncMock(return_value=predictor.return_value, side_effect=error)
+    return predictor
+
+
+class TestEnsembleAsyncForward:
+    """Test the async ensemble path."""
+
+    def test_aforward_runs_every_strategy(self, mock_chain_of_thought):
+        """Test aforward produces the same result matrix as forward."""
+        mock_chain_of_thought.side_effect = _async_predictor
+
+        result = asyncio.run(
+            ensemble.TestGenEnsemble().aforward(
+                TEST_CLASS,
+                SOURCE_CLASS,
+                strategies=["extend_coverage", "corner_cases"],
+                temperatures=[0.0, 0.5],
+            )
+        )
+
+        assert len(result.candidates) == 2 * 2 * 2
+        assert set(result.results["corner_cases"]) == {0.0, 0.5}
+
+    def test_failed_call_is_skipped(self, mock_chain_of_thought):
+        """Test a failed call leaves an empty slot instead of aborting the run."""
+        mock_chain_of_thought.side_effect = lambda signature: _async_predictor(
+            signature,
+            RuntimeError("rate limited")
+            if signature is ensemble.CornerCasesSignature
+            else None,
+        )
+
+        result = asyncio.run(
+            ensemble.TestGenEnsemble().aforward(
+                TEST_CLASS, SOURCE_CLASS, strategies=["extend_coverage", "corner_cases"]
+            )
+        )
+
+        assert result.results["corner_cases"] == {}
+        assert len(result.results["extend_coverage"][0.0]) == 2
+
+    def test_cancelled_call_propagates(self, mock_chain_of_thought):
+        """Test a cancelled call is re-raised, not collected as a prediction."""
+        mock_chain_of_thought.side_effect = lambda signature: _async_predictor(
+            signature, asyncio.CancelledError()
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(
+                ensemble.TestGenEnsemble().aforward(
+                    TEST_CLASS, SOURCE_CLASS, strategies=["extend_coverage"]
+                )
+            )
@@ -0,0 +1,245 @@
+"""
+Tests for file I/O utilities.
+"""
+
+import os
+import stat
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pytestgen_llm.utils.file_utils import (
+    TMP_ROOT_ENV,
+    create_temp_test_file,
+    dedent_code,
+    read_file,
+    temp_root,
+    write_file,
+)
+
+
+class TestWriteFile:
+    """Test atomic file writing."""
+
+    def test_write_and_read_back(self, tmp_path):
+        """Test written content is read back unchanged."""
+        target = tmp_path / "test_user.py"
+
+        write_file(str(target), "def test_user():\n    assert True\n")
+
+        assert read_file(str(target)) == "def test_user():\n    assert True\n"
+
+    def test_creates_missing_directories(self, tmp_path):
+        """Test parent directories are created on demand."""
+        target = tmp_path / "tests" / "unit" / "test_new.py"
+
+        write_file(str(target), "x = 1\n")
+
+        assert target.read_text() == "x = 1\n"
+
+    def test_keeps_existing_permissions(self, tmp_path):
+        """Test replacing a file keeps its mode."""
+        target = tmp_path / "script.py"
+        target.write_text("old")
+        os.chmod(target, 0o754)
+
+        write_file(str(target), "new")
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o754
+
+    def test_new_file_mode_follows_umask(self, tmp_path):
+        """Test a new file gets the mode a plain write would give it."""
+        target = tmp_path / "test_new.py"
+        previous = os.umask(0o027)
+        try:
+            write_file(str(target), "x = 1\n")
+        finally:
+            os.umask(previous)
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """Test a failure before the rename leaves the old file intact."""
+        target = tmp_path / "test_user.py"
+        target.write_text("original")
+
+        with (
+            patch("os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="Could not write file"),
+        ):
+            write_file(str(target), "replacement")
+
+        assert target.read_text() == "original"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_directory_fsynced_after_rename(self, tmp_path):
+        """Test the parent directory is fsynced once the file is replaced."""
+        target = tmp_path / "test_user.py"
+        synced = []
+        real_fsync = os.fsync
+
+        def fsync(fd):
+            synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+            real_fsync(fd)
+
+        with patch("os.fsync", side_effect=fsync):
+            write_file(str(target), "x = 1\n")
+
+        assert synced == [False, True]
+
+    def test_symlink_is_written_through(self, tmp_path):
+        """Test writing through a symlink updates its target and keeps the link."""
+        target = tmp_path / "real" / "test_user.py"
+        target.parent.mkdir()
+        target.write_text("old")
+        link = tmp_path / "test_link.py"
+        link.symlink_to(target)
+
+        write_file(str(link), "new")
+
+        assert link.is_symlink()
+        assert target.read_text() == "new"
+
+
+# A method whose string literal continues at column 0
+METHOD_WITH_STRING = (
+    "    def test_text(self):\n"
+    '        text = """first\n'
+    "second\n"
+    '"""\n'
+    '        assert text.endswith("\\n")\n'
+)
+
+
+class TestDedentCode:
+    """Test string-aware dedenting of extracted code."""
+
+    def test_plain_method_is_dedented(self):
+        """Test a method is moved to column 0."""
+        assert dedent_code("    def test_a(self):\n        pass\n") == (
+            "def test_a(self):\n    pass\n"
+        )
+
+    def test_string_lines_at_column_zero_are_kept(self):
+        """Test string contents stay as written while the code is dedented."""
+        assert dedent_code(METHOD_WITH_STRING) == (
+            "def test_text(self):\n"
+            '    text = """first\n'
+            "second\n"
+            '"""\n'
+            '    assert text.endswith("\\n")\n'
+        )
+
+    def test_fstring_lines_are_kept(self):
+        """Test multi-line f-string contents are not dedented either."""
+        code = '    def test_f(self):\n        x = f"""{1}\n  indented\n"""\n'
+
+        assert dedent_code(code) == (
+            'def test_f(self):\n    x = f"""{1}\n  indented\n"""\n'
+        )
+
+
+class TestTempRoot:
+    """Test resolution of the temporary file directory."""
+
+    def test_defaults_to_platform_temp_dir(self, monkeypatch):
+        """Test the platform temp directory is used when unset."""
+        monkeypatch.delenv(TMP_ROOT_ENV, raising=False)
+
+        assert temp_root() == tempfile.gettempdir()
+
+    def test_env_var_overrides(self, monkeypatch, tmp_path):
+        """Test PYTESTGEN_TMP_ROOT selects the directory."""
+        monkeypatch.setenv(TMP_ROOT_ENV, str(tmp_path))
+
+        assert temp_root() == str(tmp_path)
+
+
+class TestCreateTempTestFile:
+    """Test temporary test file creation."""
+
+    ORIGINAL = "import pytest\n\n\ndef test_existing():\n    assert True\n"
+
+    @pytest.fixture
+    def original(self, tmp_path):
+        """An existing test module."""
+        path = tmp_path / "test_user.py"
+        path.write_text(self.ORIGINAL)
+        return path
+
+    def test_appends_candidate_to_original(self, original):
+        """Test the file holds the original module followed by the candidate."""
+        temp = Path(create_temp_test_file(str(original), "def test_new():\n    pass"))
+        try:
+            assert temp.read_text() == (
+                self.ORIGINAL + "\n\n\ndef test_new():\n    pass\n"
+            )
+            assert temp.name.startswith("test_test_user_")
+            assert temp.suffix == ".py"
+        finally:
+            temp.unlink()
+
+    def test_suffix_style_original_is_collectable(self, tmp_path):
+        """Test a ``*_test.py`` original still gets a ``test_*.py`` name."""
+        original = tmp_path / "calc_test.py"
+        original.write_text(self.ORIGINAL)
+
+        temp = Path(create_temp_test_file(str(original), "def test_new(): pass"))
+        try:
+            assert temp.name.startswith("test_calc_test_")
+            assert temp.suffix == ".py"
+        finally:
+            temp.unlink()
+
+    def test_original_is_untouched(self, original):
+        """Test the original module is neither modified nor linked."""
+        temp = Path(create_temp_test_file(str(original), "def test_new(): pass"))
+        try:
+            assert original.read_text() == self.ORIGINAL
+            assert not temp.samefile(original)
+        finally:
+            temp.unlink()
+
+    def test_indented_candidate_is_dedented(self, original):
+        """Test a candidate extracted from a class is written at module level."""
+        temp = Path(
+            create_temp_test_file(str(original), "    def test_new():\n        pass")
+        )
+        try:
+            assert temp.read_text().endswith("\ndef test_new():\n    pass\n")
+        finally:
+            temp.unlink()
+
+    def test_method_with_column_zero_string_is_appended(self, original):
+        """Test a method whose string continues at column 0 stays valid."""
+        temp = Path(create_temp_test_file(str(original), METHOD_WITH_STRING))
+        try:
+            compile(temp.read_text(), str(temp), "exec")
+        finally:
+            temp.unlink()
+
+    def test_falls_back_to_copy_without_reflink(self, original):
+        """Test filesystems without reflink support get a regular copy."""
+        with patch("fcntl.ioctl", side_effect=OSError("not supported")):
+            temp = Path(create_temp_test_file(str(original), "def test_new(): pass"))
+        try:
+            assert temp.read_text().startswith(self.ORIGINAL)
+        finally:
+            temp.unlink()
+
+    def test_created_under_temp_root(self, original, monkeypatch, tmp_path):
+        """Test the file is created in the configured temp root."""
+        root = tmp_path / "shm"
+        root.mkdir()
+        monkeypatch.setenv(TMP_ROOT_ENV, str(root))
+
+        temp = Path(create_temp_test_file(str(original), "def test_new(): pass"))
+
+        assert temp.parent == root
+
+    def test_missing_original_raises(self, tmp_path):
+        """Test a missing original raises OSError and leaves no temp file."""
+        with pytest.raises(OSError, match="Could not create temporary test file"):
+            create_temp_test_file(str(tmp_path / "test_missing.py"), "x = 1")
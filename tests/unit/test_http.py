@@ -0,0 +1,42 @@
+"""
+Tests for the shared LLM HTTP connection pool.
+"""
+
+import litellm
+
+from pytestgen_llm.core.http import (
+    MAX_CONNECTIONS,
+    NUM_RETRIES,
+    REQUEST_TIMEOUT,
+    configure_http_clients,
+)
+
+
+class TestConfigureHttpClients:
+    """Test installation of the shared HTTP client."""
+
+    def test_client_installed_in_litellm(self):
+        """Test LiteLLM uses the shared client and retry settings."""
+        client = configure_http_clients()
+
+        assert litellm.client_session is client
+        assert litellm.num_retries == NUM_RETRIES
+        assert litellm.request_timeout == REQUEST_TIMEOUT
+
+    def test_async_session_left_to_litellm(self):
+        """Test no process-wide async client is bound to one event loop."""
+        configure_http_clients()
+
+        assert litellm.aclient_session is None
+
+    def test_client_created_once(self):
+        """Test repeated calls return the same pooled client."""
+        assert configure_http_clients() is configure_http_clients()
+
+    def test_pool_limits(self):
+        """Test the pool allows the configured number of connections."""
+        client = configure_http_clients()
+        pool = client._transport._pool
+
+        assert pool._max_connections == MAX_CONNECTIONS
+        assert pool._max_keepalive_connections == MAX_CONNECTIONS
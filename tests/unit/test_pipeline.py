@@ -0,0 +1,162 @@
+"""
+Tests for the filtration pipeline orchestrator.
+"""
+
+import threading
+import time
+
+import pytest
+
+from pytestgen_llm.filters import BaseFilter, CollectionFilter, FilterPipeline
+
+CANDIDATE = "def test_ok():\n    assert True"
+
+
+class RecordingFilter(BaseFilter):
+    """Filter stand-in that records calls and accepts or rejects everything."""
+
+    def __init__(self, name, cost, accept=True, calls=None):
+        self.name = name
+        self.cost = cost
+        self.accept = accept
+        self.calls = calls if calls is not None else []
+
+    def filter(self, candidate_test):
+        self.calls.append(self.name)
+        return candidate_test if self.accept else None
+
+    def get_filter_name(self):
+        return self.name
+
+
+class TestFilterPipeline:
+    """Test ordering and short-circuiting of the pipeline."""
+
+    def test_filters_run_cheapest_first(self):
+        """Test filters are applied in ascending cost order."""
+        calls = []
+        pipeline = FilterPipeline(
+            [
+                RecordingFilter("pytest", 100, calls=calls),
+                RecordingFilter("ast", 1, calls=calls),
+                RecordingFilter("coverage", 10, calls=calls),
+            ]
+        )
+
+        assert pipeline.run_pipeline(CANDIDATE) == CANDIDATE
+        assert calls == ["ast", "coverage", "pytest"]
+
+    def test_equal_costs_keep_given_order(self):
+        """Test the cost sort is stable."""
+        calls = []
+        pipeline = FilterPipeline(
+            [RecordingFilter(name, 1, calls=calls) for name in ("b", "a", "c")]
+        )
+
+        pipeline.run_pipeline(CANDIDATE)
+        assert calls == ["b", "a", "c"]
+
+    def test_first_rejection_short_circuits(self):
+        """Test expensive filters never see a candidate a cheap one rejected."""
+        calls = []
+        pipeline = FilterPipeline(
+            [
+                RecordingFilter("pytest", 100, calls=calls),
+                RecordingFilter("ast", 1, accept=False, calls=calls),
+            ]
+        )
+
+        assert pipeline.run_pipeline(CANDIDATE) is None
+        assert calls == ["ast"]
+
+    def test_default_cost(self):
+        """Test filters without an explicit cost are treated as cheap."""
+        assert BaseFilter.cost == 1
+
+    def test_structural_filters_are_accepted(self):
+        """Test any object with the filter methods works without subclassing."""
+
+        class UpperFilter:
+            cost = 1
+
+            def filter(self, candidate_test):
+                return candidate_test.upper()
+
+            def get_filter_name(self):
+                return "upper"
+
+        calls = []
+        pipeline = FilterPipeline(
+            [RecordingFilter("pytest", 100, calls=calls), UpperFilter()]
+        )
+
+        assert isinstance(UpperFilter(), BaseFilter)
+        assert pipeline.run_pipeline(CANDIDATE) == CANDIDATE.upper()
+        assert calls == ["pytest"]
+
+    def test_subclass_missing_filter_cannot_be_instantiated(self):
+        """Test a subclass that forgets filter() fails loudly, not silently."""
+
+        class NamedOnly(BaseFilter):
+            def get_filter_name(self):
+                return "named_only"
+
+        with pytest.raises(TypeError, match="abstract"):
+            NamedOnly()
+
+    def test_concrete_filters_have_no_instance_dict(self):
+        """Test built-in filters use slots."""
+        assert not hasattr(CollectionFilter(), "__dict__")
+
+
+class SlowFilter(BaseFilter):
+    """Expensive filter stand-in that tracks how many calls overlap."""
+
+    cost = 100
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.seen = []
+
+    def filter(self, candidate_test):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.seen.append(candidate_test)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return candidate_test.upper()
+
+    def get_filter_name(self):
+        return "slow"
+
+
+class TestFilterPipelineBatch:
+    """Test batch filtering across candidates."""
+
+    def test_results_align_with_candidates(self):
+        """Test each candidate gets its own result or None, in order."""
+        cheap = RecordingFilter("ast", 1)
+        cheap.filter = lambda c: None if "bad" in c else c
+        pipeline = FilterPipeline([SlowFilter(), cheap])
+
+        assert pipeline.run_batch(["a", "bad", "c"]) == ["A", None, "C"]
+
+    def test_expensive_filters_only_see_survivors(self):
+        """Test candidates rejected by cheap filters skip expensive ones."""
+        slow = SlowFilter()
+        cheap = RecordingFilter("ast", 1)
+        cheap.filter = lambda c: None if "bad" in c else c
+
+        FilterPipeline([slow, cheap]).run_batch(["a", "bad"])
+        assert slow.seen == ["a"]
+
+    def test_expensive_filters_run_concurrently(self):
+        """Test the expensive stage checks several candidates at once."""
+        slow = SlowFilter()
+
+        FilterPipeline([slow], max_workers=4).run_batch(["a", "b", "c", "d"])
+        assert slow.max_active > 1
@@ -2,25 +2,88 @@
 Comprehensive tests for DSPy signature definitions and validation.
 """
 
+import ast
 from unittest.mock import patch
 
 import dspy
 import pytest
 from pydantic import ValidationError
 
+from pytestgen_llm.core import signatures
 from pytestgen_llm.core.signatures import (
     CodeInput,
     CornerCasesSignature,
     ExtendCoverageSignature,
     ExtendTestSignature,
+    ParsedTest,
     SignatureValidationError,
     StatementCompleteSignature,
     extract_test_name,
+    fingerprint_test,
     normalize_test_code,
     parse_test_functions,
+    parse_tests,
     validate_signature_inputs,
 )
 
+VALID_TEST_CLASS = """
+import pytest
+
+class TestExample:
+    def test_basic_functionality(self):
+        assert True
+
+    def test_edge_case(self):
+        assert 1 + 1 == 2
+""".strip()
+VALID_SOURCE_CLASS = """
+class Calculator:
+    def add(self, a, b):
+        return a + b
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ValueError("Cannot divide by zero")
+        return a / b
+""".strip()
+SAMPLE_TEST_CLASS = """
+import pytest
+from calculator import Calculator
+
+class TestCalculator:
+    def setup_method(self):
+        self.calc = Calculator()
+
+    def test_add_positive_numbers(self):
+        result = self.calc.add(2, 3)
+        assert result == 5
+
+    def test_add_negative_numbers(self):
+        result = self.calc.add(-2, -3)
+        assert result == -5
+""".strip()
+SAMPLE_SOURCE_CLASS = """
+class Calculator:
+    def __init__(self):
+        self.history = []
+
+    def add(self, a, b):
+        result = a + b
+        self.history.append(f"add({a}, {b}) = {result}")
+        return result
+
+    def subtract(self, a, b):
+        result = a - b
+        self.history.append(f"subtract({a}, {b}) = {result}")
+        return result
+
+    def get_history(self):
+        return self.history.copy()
+
+    def clear_history(self):
+        self.history.clear()
+""".strip()
+
 
 class TestSignatureClasses:
     """Test that all signature classes are properly defined."""
@@ -105,43 +168,51 @@ def test_invalid(:
         with pytest.raises(ValueError, match="Code cannot be empty"):
             CodeInput(code="   \n  \t  ")
 
+    def test_whitespace_only_skips_parser(self):
+        """Test blank code is rejected before it reaches the parser."""
+        with patch("ast.parse") as parse, pytest.raises(ValueError):
+            CodeInput(code="  \n\n  ")
+
+        parse.assert_not_called()
+
     def test_custom_file_type(self):
         """Test custom file type is preserved."""
         valid_code = "def function(): pass"
         input_model = CodeInput(code=valid_code, file_type="source")
         assert input_model.file_type == "source"
 
+    def test_validation_and_parsing_share_one_parse(self):
+        """Test validating then parsing the same code parses it once."""
+        code = "def test_shared_parse():\n    assert True"
+        with patch("ast.parse", wraps=ast.parse) as parse:
+            CodeInput(code=code)
+            parse_test_functions(code)
+
+        assert parse.call_count == 1
+
+    def test_syntax_errors_are_cached(self):
+        """Test invalid code is parsed once and still fails every time."""
+        code = "def test_cached_failure(:\n    pass"
+        with patch("ast.parse", wraps=ast.parse) as parse:
+            for _ in range(3):
+                with pytest.raises(ValidationError, match="Invalid Python syntax"):
+                    CodeInput(code=code)
+
+        assert parse.call_count == 1
+
 
 class TestValidateSignatureInputs:
     """Test the signature input validation function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_test_class(self):
         """Fixture providing valid test class code."""
-        return """
-import pytest
-
-class TestExample:
-    def test_basic_functionality(self):
-        assert True
+        return VALID_TEST_CLASS
 
-    def test_edge_case(self):
-        assert 1 + 1 == 2
-        """
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def valid_source_class(self):
         """Fixture providing valid source class code."""
-        return """
-class Calculator:
-    def add(self, a, b):
-        return a + b
-
-    def divide(self, a, b):
-        if b == 0:
-            raise ValueError("Cannot divide by zero")
-        return a / b
-        """
+        return VALID_SOURCE_CLASS
 
     def test_valid_inputs_with_source_class(self, valid_test_class, valid_source_class):
         """Test validation passes with valid inputs including source class."""
@@ -149,18 +220,15 @@ class Calculator:
             existing_test_class=valid_test_class, class_under_test=valid_source_class
         )
 
-        assert "existing_test_class" in result
-        assert "class_under_test" in result
-        assert result["existing_test_class"] == valid_test_class
-        assert result["class_under_test"] == valid_source_class
+        assert result.get("existing_test_class") == valid_test_class
+        assert result.get("class_under_test") == valid_source_class
 
     def test_valid_inputs_without_source_class(self, valid_test_class):
         """Test validation passes with valid inputs without source class."""
         result = validate_signature_inputs(existing_test_class=valid_test_class)
 
-        assert "existing_test_class" in result
+        assert result.get("existing_test_class") == valid_test_class
         assert "class_under_test" not in result
-        assert result["existing_test_class"] == valid_test_class
 
     def test_valid_inputs_with_completion_prompt(
         self, valid_test_class, valid_source_class
@@ -173,8 +241,7 @@ class Calculator:
             completion_prompt=prompt,
         )
 
-        assert "completion_prompt" in result
-        assert result["completion_prompt"] == prompt
+        assert result.get("completion_prompt") == prompt
 
     def test_invalid_test_class_syntax(self):
         """Test validation fails with invalid test class syntax."""
@@ -183,6 +250,11 @@ class Calculator:
         with pytest.raises(SignatureValidationError, match="Input validation failed"):
             validate_signature_inputs(existing_test_class=invalid_code)
 
+    def test_whitespace_test_class(self):
+        """Test validation fails for a whitespace-only test class."""
+        with pytest.raises(SignatureValidationError, match="Code cannot be empty"):
+            validate_signature_inputs(existing_test_class="  \n\t ")
+
     def test_test_class_without_test_functions(self):
         """Test validation fails when test class has no test functions."""
         code_without_tests = """
@@ -199,6 +271,57 @@ class TestExample:
         ):
             validate_signature_inputs(existing_test_class=code_without_tests)
 
+    def test_test_name_in_string_is_not_a_test(self):
+        """Test only real test definitions satisfy the check."""
+        code = 'DOC = "def test_fake(): pass"\n\ndef helper():\n    pass\n'
+
+        with pytest.raises(
+            SignatureValidationError, match="must contain at least one test function"
+        ):
+            validate_signature_inputs(existing_test_class=code)
+
+    def test_async_test_functions_accepted(self):
+        """Test async tests (pytest-asyncio, anyio) count as test functions."""
+        async_tests = """
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_fetch():
+    assert True
+"""
+
+        result = validate_signature_inputs(existing_test_class=async_tests)
+        assert result["existing_test_class"] == async_tests
+
+    def test_nested_class_tests_accepted(self):
+        """Test tests in nested classes and under if blocks are found."""
+        nested_tests = """
+class TestOuter:
+    class TestInner:
+        def test_nested(self):
+            assert True
+"""
+        guarded_tests = """
+import sys
+
+if sys.platform != "win32":
+
+    def test_posix_only():
+        assert True
+"""
+
+        validate_signature_inputs(existing_test_class=nested_tests)
+        validate_signature_inputs(existing_test_class=guarded_tests)
+
+    def test_test_class_parsed_once(self):
+        """Test the syntax and test function checks share one parse."""
+        code = "def test_single_parse():\n    assert True\n"
+        with patch("ast.parse", wraps=ast.parse) as parse:
+            validate_signature_inputs(existing_test_class=code)
+
+        assert parse.call_count == 1
+
     def test_invalid_source_class_syntax(self, valid_test_class):
         """Test validation fails with invalid source class syntax."""
         invalid_source = "class Invalid(:"
@@ -253,10 +376,8 @@ def test_third():
         assert len(result) == 3
 
         # Check that only test functions are extracted
-        test_names = [extract_test_name(func) for func in result]
-        assert "test_first" in test_names
-        assert "test_second" in test_names
-        assert "test_third" in test_names
+        test_names = {extract_test_name(func) for func in result}
+        assert test_names == {"test_first", "test_second", "test_third"}
 
     def test_parse_empty_output_raises_error(self):
         """Test parsing empty output raises error."""
@@ -313,6 +434,102 @@ def test_complex_scenario():
         assert "calculator = Calculator()" in result[0]
         assert "assert results == expected" in result[0]
 
+    def test_parse_class_methods_separately(self):
+        """Test methods of a generated test class are split at their own end."""
+        class_output = """
+class TestGenerated:
+    def test_first(self):
+        assert 1 == 1
+
+    def test_second(self):
+        assert 2 == 2
+"""
+
+        result = parse_test_functions(class_output)
+        assert len(result) == 2
+        assert "test_second" not in result[0]
+        assert result[1].strip().startswith("def test_second(self):")
+
+    def test_parse_keeps_decorators(self):
+        """Test decorators are extracted with their test function."""
+        decorated_output = """
+@pytest.mark.parametrize("value", [1, 2])
+def test_positive(value):
+    assert value > 0
+"""
+
+        result = parse_test_functions(decorated_output)
+        assert result[0].startswith("@pytest.mark.parametrize")
+        assert result[0].endswith("assert value > 0")
+
+    def test_parse_ignores_nested_definitions(self):
+        """Test functions defined inside a test body are not separate tests."""
+        nested_output = """
+def test_outer():
+    def test_inner():
+        pass
+    test_inner()
+"""
+
+        result = parse_test_functions(nested_output)
+        assert len(result) == 1
+        assert "test_inner()" in result[0]
+
+    def test_parse_async_test_functions(self):
+        """Test async test functions are extracted like sync ones."""
+        result = parse_test_functions("async def test_fetch():\n    assert True\n")
+
+        assert result == ["async def test_fetch():\n    assert True"]
+
+    def test_parse_windows_line_endings(self):
+        """Test CRLF output is split on the same lines the parser saw."""
+        result = parse_test_functions(
+            "def test_a():\r\n    assert True\r\n\r\ndef test_b():\r\n    pass\r\n"
+        )
+
+        assert result == ["def test_a():\n    assert True", "def test_b():\n    pass"]
+
+
+class TestParsedTest:
+    """Test the parse-once test representation."""
+
+    def test_of_parses_indented_method(self):
+        """Test a method extracted from a class is parsed after dedenting."""
+        parsed = ParsedTest.of("    def test_method(self):\n        assert True")
+
+        assert parsed.name == "test_method"
+        assert parsed.source.startswith("    def")
+
+    def test_of_parses_method_with_column_zero_string(self):
+        """Test a method whose string literal continues at column 0 parses."""
+        parsed = ParsedTest.of(
+            '    def test_text(self):\n        text = """a\nb\n"""\n        assert text\n'
+        )
+
+        assert parsed.name == "test_text"
+
+    def test_name_without_tests_raises(self):
+        """Test code without a test function has no name."""
+        with pytest.raises(SignatureValidationError):
+            ParsedTest.of("def helper():\n    pass").name
+
+    def test_parse_tests_reuses_output_tree(self):
+        """Test extracted tests are not parsed again on their own."""
+        output = "def test_a():\n    pass\n\ndef test_b():\n    pass\n"
+
+        with patch("ast.parse", wraps=ast.parse) as parse:
+            tests = parse_tests(output + "\n# unique")
+
+        assert parse.call_count == 1
+        assert [test.name for test in tests] == ["test_a", "test_b"]
+        assert [test.source for test in tests] == parse_test_functions(output)
+
+    def test_extract_test_name_accepts_parsed_test(self):
+        """Test name extraction uses the tree of a parsed test."""
+        (test,) = parse_tests("@mark\ndef test_marked():\n    pass")
+
+        assert extract_test_name(test) == "test_marked"
+
 
 class TestExtractTestName:
     """Test the test name extraction utility."""
@@ -360,6 +577,18 @@ def helper_function():
         ):
             extract_test_name(invalid_code)
 
+    def test_extract_test_name_is_memoized(self):
+        """Test repeated lookups of equal source reuse the first result."""
+        code = "def test_memoized():\n    pass"
+        extract_test_name(code)
+
+        with patch.object(signatures, "_TEST_DEF_RE") as regex:
+            assert extract_test_name("def test_memoized():\n" + "    pass") == (
+                "test_memoized"
+            )
+
+        regex.search.assert_not_called()
+
 
 class TestNormalizeTestCode:
     """Test the test code normalization utility."""
@@ -379,6 +608,12 @@ def test_example():
         assert not result.endswith(" ")
         assert "\n\n\n" not in result
 
+    def test_normalize_collapses_blank_runs(self):
+        """Test any run of blank or whitespace-only lines becomes one blank line."""
+        code = "def test_a():\n    x = 1\n\n  \n\n\t\n\n    assert x\n"
+
+        assert normalize_test_code(code) == "def test_a():\n    x = 1\n\n    assert x"
+
     def test_normalize_handles_different_line_endings(self):
         """Test normalization handles different line endings."""
         windows_code = "def test_example():\r\n    assert True\r\n"
@@ -393,6 +628,12 @@ def test_example():
         assert windows_result == mac_result == unix_result
         assert "\r" not in windows_result
 
+    def test_normalize_keeps_unicode_line_separators(self):
+        """Test only CR and LF end lines; other separators in literals stay."""
+        code = 'def test_sep():\n    assert "a\u2028b\x0cc" != ""\n'
+
+        assert normalize_test_code(code) == code.strip()
+
     def test_normalize_preserves_indentation(self):
         """Test normalization preserves proper indentation."""
         indented_code = """
@@ -430,14 +671,40 @@ def test_example():
                 assert not line.endswith("\t")
 
 
+class TestFingerprintTest:
+    """Test the duplicate-detection fingerprint."""
+
+    def test_equivalent_code_shares_fingerprint(self):
+        """Test code differing only in formatting noise has one fingerprint."""
+        first = normalize_test_code("def test_a():\r\n    assert True  \r\n")
+        second = normalize_test_code("\ndef test_a():\n    assert True\n\n")
+
+        assert fingerprint_test(first) == fingerprint_test(second)
+
+    def test_different_code_differs(self):
+        """Test different tests get different 16-byte fingerprints."""
+        first = fingerprint_test("def test_a():\n    assert True")
+        second = fingerprint_test("def test_a():\n    assert False")
+
+        assert first != second
+        assert len(first) == 16
+
+
+@pytest.fixture(scope="module")
+def mock_dspy_predict():
+    """Mock DSPy Predict for testing, installed once for the module."""
+    with patch("dspy.Predict") as mock:
+        yield mock
+
+
 class TestSignatureIntegration:
     """Integration tests for DSPy signature functionality."""
 
-    @pytest.fixture
-    def mock_dspy_predict(self):
-        """Mock DSPy Predict for testing."""
-        with patch("dspy.Predict") as mock:
-            yield mock
+    @pytest.fixture(autouse=True)
+    def _reset_mock_dspy_predict(self, mock_dspy_predict):
+        """Give every test a mock without calls from earlier tests."""
+        yield
+        mock_dspy_predict.reset_mock()
 
     def test_signature_can_be_used_with_dspy_predict(self, mock_dspy_predict):
         """Test that signatures can be used with dspy.Predict."""
@@ -462,51 +729,16 @@ class TestSignatureIntegration:
             assert predictor is not None
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_test_class():
     """Fixture providing a sample test class for testing."""
-    return """
-import pytest
-from calculator import Calculator
-
-class TestCalculator:
-    def setup_method(self):
-        self.calc = Calculator()
-
-    def test_add_positive_numbers(self):
-        result = self.calc.add(2, 3)
-        assert result == 5
-
-    def test_add_negative_numbers(self):
-        result = self.calc.add(-2, -3)
-        assert result == -5
-    """
+    return SAMPLE_TEST_CLASS
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_source_class():
     """Fixture providing a sample source class for testing."""
-    return """
-class Calculator:
-    def __init__(self):
-        self.history = []
-
-    def add(self, a, b):
-        result = a + b
-        self.history.append(f"add({a}, {b}) = {result}")
-        return result
-
-    def subtract(self, a, b):
-        result = a - b
-        self.history.append(f"subtract({a}, {b}) = {result}")
-        return result
-
-    def get_history(self):
-        return self.history.copy()
-
-    def clear_history(self):
-        self.history.clear()
-    """
+    return SAMPLE_SOURCE_CLASS
 
 
 class TestSignatureValidationIntegration:
@@ -520,10 +752,9 @@ class TestSignatureValidationIntegration:
             completion_prompt="Generate edge case tests",
         )
 
-        assert "existing_test_class" in result
-        assert "class_under_test" in result
-        assert "completion_prompt" in result
-        assert result["completion_prompt"] == "Generate edge case tests"
+        assert result.get("existing_test_class") == sample_test_class
+        assert result.get("class_under_test") == sample_source_class
+        assert result.get("completion_prompt") == "Generate edge case tests"
 
     def test_parse_realistic_test_output(self):
         """Test parsing realistic test function output."""
@@ -552,12 +783,9 @@ def test_calculator_clear_history(self):
         result = parse_test_functions(realistic_output)
         assert len(result) == 3
 
-        names = [extract_test_name(func) for func in result]
-        expected_names = [
+        names = {extract_test_name(func) for func in result}
+        assert names == {
             "test_calculator_divide_by_zero",
             "test_calculator_history_tracking",
             "test_calculator_clear_history",
-        ]
-
-        for name in expected_names:
-            assert name in names
+        }
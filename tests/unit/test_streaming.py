@@ -0,0 +1,124 @@
+"""
+Tests for incremental test extraction from streamed LLM output.
+"""
+
+import dspy
+
+from pytestgen_llm.core.streaming import iter_completed_tests, iter_stream_text
+
+GENERATED = """```python
+import pytest
+
+def test_first():
+    assert 1 == 1
+
+def helper():
+    return True
+
+def test_second():
+    values = [
+1, 2]
+    assert helper()
+```"""
+
+
+def _chunked(text, size=7):
+    """Split text into fixed-size chunks, like a token stream."""
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+class TestIterCompletedTests:
+    """Test extraction of complete tests from text chunks."""
+
+    def test_extracts_only_test_functions(self):
+        """Test helpers, imports and code fences are dropped."""
+        tests = list(iter_completed_tests(_chunked(GENERATED)))
+
+        assert len(tests) == 2
+        assert tests[0].startswith("def test_first():")
+        assert tests[1].startswith("def test_second():")
+
+    def test_yields_before_stream_ends(self):
+        """Test the first test is available while later chunks are pending."""
+        consumed = []
+
+        def stream():
+            for chunk in _chunked(GENERATED):
+                consumed.append(chunk)
+                yield chunk
+
+        first = next(iter_completed_tests(stream()))
+
+        assert first.startswith("def test_first():")
+        assert len(consumed) < len(_chunked(GENERATED))
+
+    def test_incomplete_block_waits_for_more_lines(self):
+        """Test a column-0 continuation line does not split a statement."""
+        tests = list(iter_completed_tests(_chunked(GENERATED, size=3)))
+
+        assert len(tests) == 2
+        assert tests[1].startswith("def test_second():")
+
+    def test_invalid_trailing_block_is_dropped(self):
+        """Test a truncated final function is not yielded."""
+        text = "def test_ok():\n    assert True\n\ndef test_cut(:\n"
+
+        tests = list(iter_completed_tests(_chunked(text)))
+
+        assert len(tests) == 1
+        assert tests[0].startswith("def test_ok():")
+
+    def test_statement_between_tests_does_not_split_stream(self):
+        """Test a module-level statement between tests loses no later test."""
+        text = (
+            "def test_first():\n    assert True\n\n"
+            "if True:\n    TIMEOUT = 1\nelse:\n    TIMEOUT = 2\n\n"
+            "def test_second():\n    assert TIMEOUT\n\n"
+            "def test_third():\n    assert True\n"
+        )
+
+        tests = list(iter_completed_tests(_chunked(text)))
+
+        assert [test.split("(")[0] for test in tests] == [
+            "def test_first",
+            "def test_second",
+            "def test_third",
+        ]
+
+    def test_column_zero_clause_stays_with_its_statement(self):
+        """Test an ``else:`` after a parseable block does not end the block."""
+        text = (
+            "if True:\n    def test_new():\n        assert True\n"
+            "else:\n    def test_old():\n        assert True\n\n"
+            "@pytest.mark.slow\ndef test_last():\n    assert True\n"
+        )
+
+        tests = list(iter_completed_tests(_chunked(text)))
+
+        assert len(tests) == 3
+        assert tests[-1].startswith("@pytest.mark.slow\ndef test_last():")
+
+
+class TestIterStreamText:
+    """Test reduction of streamify output to field text."""
+
+    def test_streamed_chunks_of_field(self):
+        """Test only chunks of the requested field are kept."""
+        stream = [
+            dspy.streaming.StreamResponse("p", "reasoning", "thinking", False),
+            dspy.streaming.StreamResponse("p", "extended_tests", "def test_", False),
+            dspy.streaming.StreamResponse("p", "extended_tests", "a(): pass", True),
+            dspy.Prediction(extended_tests="def test_a(): pass"),
+        ]
+
+        assert "".join(iter_stream_text(stream, "extended_tests")) == (
+            "def test_a(): pass"
+        )
+
+    def test_falls_back_to_final_prediction(self):
+        """Test cached (unstreamed) results are taken from the prediction."""
+        stream = [dspy.Prediction(extended_tests="def test_a(): pass")]
+
+        assert list(iter_stream_text(stream, "extended_tests")) == [
+            "def test_a(): pass"
+        ]
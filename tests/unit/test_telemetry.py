@@ -0,0 +1,191 @@
+"""
+Tests for telemetry collection.
+"""
+
+import json
+import threading
+import time
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from pytestgen_llm.telemetry import TelemetryCollector, log_telemetry
+from pytestgen_llm.telemetry import collector as collector_module
+from pytestgen_llm.telemetry.collector import TELEMETRY_FILE_ENV
+
+
+@pytest.fixture
+def collector(tmp_path):
+    """A collector writing to a temporary file."""
+    collector = TelemetryCollector(tmp_path / "telemetry.jsonl")
+    yield collector
+    collector.close()
+
+
+def _read_events(path):
+    """Parse the JSON lines written to a telemetry file."""
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestTelemetryCollector:
+    """Test queued event logging."""
+
+    def test_events_written_as_json_lines(self, collector):
+        """Test flushed events are appended one JSON object per line."""
+        collector.log_event("generation_success", strategy="corner_cases")
+        collector.log_event("generation_error", error="timeout")
+        collector.flush()
+
+        events = _read_events(collector.path)
+        assert [e["event"] for e in events] == [
+            "generation_success",
+            "generation_error",
+        ]
+        assert events[0]["data"] == {"strategy": "corner_cases"}
+        assert events[0]["timestamp_ns"] <= events[1]["timestamp_ns"]
+
+    def test_log_event_does_not_wait_for_writes(self, collector):
+        """Test logging returns while the writer is blocked on I/O."""
+        release = threading.Event()
+        with patch.object(collector, "_write", side_effect=lambda _: release.wait()):
+            collector.log_event("first")
+            time.sleep(0.2)  # let the writer pick up the first batch and block
+
+            start = time.perf_counter()
+            for i in range(100):
+                collector.log_event("more", i=i)
+            elapsed = time.perf_counter() - start
+            release.set()
+
+        assert elapsed < 0.1
+
+    def test_unserializable_data_stored_as_string(self, collector):
+        """Test odd payload values do not lose the event."""
+        collector.log_event("odd", path=collector.path)
+        collector.flush()
+
+        assert _read_events(collector.path)[0]["data"] == {"path": str(collector.path)}
+
+    def test_unencodable_event_keeps_the_batch(self, collector):
+        """Test an event no encoder accepts only loses its own data."""
+        collector.log_event("good")
+        collector.log_event("bad", m={(1, 2): 3})
+        collector.log_event("good2")
+        collector.flush()
+
+        events = _read_events(collector.path)
+        assert [e["event"] for e in events] == ["good", "bad", "good2"]
+        assert events[1]["data"] == repr({"m": {(1, 2): 3}})
+
+    def test_encoders_agree(self, collector):
+        """Test the orjson and standard library encodings read back the same."""
+        collector.log_event("event", temp=0.5, big=2**70, keys={1: "a"})
+        collector.flush()
+        with patch.object(collector_module, "orjson", None):
+            collector.log_event("event", temp=0.5, big=2**70, keys={1: "a"})
+            collector.flush()
+
+        first, second = _read_events(collector.path)
+        assert first["data"] == second["data"]
+        assert first["data"]["big"] == 2**70
+
+    def test_fallback_encoding_is_compact(self, collector):
+        """Test the standard library encoder writes orjson's separators."""
+        with patch.object(collector_module, "orjson", None):
+            collector.log_event("event", keys={"a": 1})
+            collector.flush()
+
+        assert b'"data":{"keys":{"a":1}}' in collector.path.read_bytes()
+
+    def test_write_errors_are_swallowed(self, tmp_path):
+        """Test an unwritable log file does not break logging."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        collector = TelemetryCollector(blocker / "telemetry.jsonl")
+
+        collector.log_event("event")
+        collector.flush()
+        collector.close()
+
+        assert not collector._thread.is_alive()
+
+    def test_writer_starts_on_first_event(self, collector):
+        """Test creating a collector starts no thread until an event is logged."""
+        assert collector._thread is None
+
+        collector.log_event("event")
+
+        assert collector._thread.is_alive()
+
+    def test_forked_child_starts_its_own_writer(self, tmp_path):
+        """Test the fork hook drops the parent's writer so the child starts one."""
+        with patch.object(collector_module.os, "register_at_fork") as register:
+            collector = TelemetryCollector(tmp_path / "telemetry.jsonl")
+        after_in_child = register.call_args.kwargs["after_in_child"]
+        collector.log_event("parent")
+        collector.flush()
+        parent_thread, parent_queue = collector._thread, collector._queue
+
+        after_in_child()
+        assert collector._thread is None
+        collector.log_event("child")
+        collector.close()
+        parent_queue.put_nowait((collector_module._STOP, None))
+        parent_thread.join()
+
+        assert collector._thread is not parent_thread
+        assert [e["event"] for e in _read_events(collector.path)] == [
+            "parent",
+            "child",
+        ]
+
+    def test_fork_hook_does_not_keep_collector_alive(self, tmp_path):
+        """Test a collector registered for fork handling can be collected."""
+        with patch.object(collector_module.os, "register_at_fork") as register:
+            collector = TelemetryCollector(tmp_path / "telemetry.jsonl")
+        after_in_child = register.call_args.kwargs["after_in_child"]
+        collector_ref = weakref.ref(collector)
+        del collector
+
+        assert collector_ref() is None
+        after_in_child()
+
+    def test_close_writes_pending_events(self, tmp_path):
+        """Test closing writes everything logged before it."""
+        collector = TelemetryCollector(tmp_path / "telemetry.jsonl")
+        for i in range(3):
+            collector.log_event("event", i=i)
+        collector.close()
+
+        assert [e["data"]["i"] for e in _read_events(collector.path)] == [0, 1, 2]
+
+
+class TestLogTelemetry:
+    """Test the module-level convenience function."""
+
+    def test_positional_details_stored_as_args(self, collector):
+        """Test positional and keyword details are both kept."""
+        collector.log_event("generation_success", "extend_test", 0.5, 3, model="m")
+        collector.flush()
+
+        (event,) = _read_events(collector.path)
+        assert event["data"] == {"args": ["extend_test", 0.5, 3], "model": "m"}
+
+    def test_logs_to_process_wide_collector(self, telemetry_file):
+        """Test log_telemetry is the default collector's log_event."""
+        log_telemetry("log_telemetry_check", "corner_cases")
+        log_telemetry.__self__.flush()
+
+        events = [
+            e
+            for e in _read_events(telemetry_file)
+            if e["event"] == "log_telemetry_check"
+        ]
+        assert [e["data"] for e in events] == [{"args": ["corner_cases"]}]
+
+    def test_default_path_follows_environment(self, monkeypatch, tmp_path):
+        """Test a collector without a path reads the file from the environment."""
+        monkeypatch.setenv(TELEMETRY_FILE_ENV, str(tmp_path / "events.jsonl"))
+
+        assert log_telemetry.__self__.path == tmp_path / "events.jsonl"